@@ -2,38 +2,64 @@
 Dataset Agent - Optimized (with Kaggle + GitHub tools)
 """
 
-from crewai import Agent, LLM
-from tools.kaggle_tool import kaggle_dataset_tool
-from tools.github_code_tool import github_code_tool
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-gemini_api_key = os.getenv("GEMINI_API_KEY")
-
-llm = LLM(
-    model="gemini/gemini-2.0-flash", api_key=gemini_api_key, temperature=0.25
-)
-
-dataset_agent = Agent(
-    name="Dataset Curator",
-    role="Data engineer specializing in dataset evaluation and curation",
-    goal="For every AI use case, map Kaggle datasets and GitHub code repos to ensure completeness.",
-    backstory="7+ year data engineer with expertise in dataset quality assessment",
-    verbose=True,
-    memory=True,
-    tools=[kaggle_dataset_tool, github_code_tool],  # ✅ specialized tools
-    allow_delegation=False,
-    system_message=(
-        "DATASET & RESOURCE CURATION:\n"
-        "Loop through **every use case** provided.\n"
-        "For each use case output:\n"
-        "1. KAGGLE DATASETS (via Kaggle API)\n"
-        "   - [Dataset Name](URL), size, quality score\n"
-        "2. GITHUB REPOSITORIES (via GitHub API)\n"
-        "   - [Repo Name](URL), stars, description\n"
-        "3. Note any data preparation requirements\n"
-        "Do not skip any use case. Ensure coverage for all."
-    ),
-    llm=llm,
-)
\ No newline at end of file
+from functools import lru_cache
+from crewai import Agent
+from config.llm import build_llm
+from config.usecases import extract_portfolio
+
+
+class DatasetAgent(Agent):
+    """Dataset agent that skips its LLM when the use cases arrive as a validated JSON block"""
+
+    fanout: bool = True
+
+    def execute_task(self, task, context=None, tools=None):
+        portfolio = extract_portfolio(context) if self.fanout and context else None
+        if portfolio is None:
+            return super().execute_task(task, context, tools)
+
+        from tools.aio import run_sync
+        from tools.batch_search_tool import batch_resource_search_tool
+
+        # one concurrent search per use case instead of an LLM turn per tool call
+        print(f"⚡ Dataset fan-out: {len(portfolio.use_cases)} use cases searched without the LLM")
+        return run_sync(batch_resource_search_tool.asearch_use_cases(portfolio))
+
+
+@lru_cache(maxsize=None)
+def _shared_resources():
+    """LLM client and tools, built once per process and shared by every run's dataset agent"""
+    from tools.batch_search_tool import batch_resource_search_tool
+    from tools.kaggle_tool import kaggle_dataset_tool
+    from tools.github_code_tool import github_code_tool
+
+    return build_llm("dataset"), [batch_resource_search_tool, kaggle_dataset_tool, github_code_tool]
+
+
+def create_dataset_agent() -> Agent:
+    """A fresh dataset agent for one crew run, so concurrent runs never share agent state"""
+    llm, tools = _shared_resources()
+    return DatasetAgent(
+        fanout=os.getenv("DATASET_FANOUT", "1") != "0",
+        name="Dataset Curator",
+        role="Data engineer specializing in dataset evaluation and curation",
+        goal="For every AI use case, map Kaggle datasets and GitHub code repos to ensure completeness.",
+        backstory="7+ year data engineer with expertise in dataset quality assessment",
+        verbose=True,
+        tools=list(tools),  # ✅ batch first, singles to fill gaps
+        allow_delegation=False,
+        system_message=(
+            "DATASET & RESOURCE CURATION:\n"
+            "Write one short search query per use case, then call Batch Resource Search ONCE with the full list.\n"
+            "Use the single Kaggle/GitHub tools only to refine a use case that came back empty.\n"
+            "For each use case output:\n"
+            "1. KAGGLE DATASETS (via Kaggle API)\n"
+            "   - [Dataset Name](URL), size, quality score\n"
+            "2. GITHUB REPOSITORIES (via GitHub API)\n"
+            "   - [Repo Name](URL), stars, description\n"
+            "3. Note any data preparation requirements\n"
+            "Do not skip any use case. Ensure coverage for all."
+        ),
+        llm=llm,
+    )
@@ -2,56 +2,79 @@
 Final Proposal Agent - Optimized
 """
 
-from crewai import Agent, LLM
-from tools.filemanager_tool import file_manager_tool
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-gemini_api_key = os.getenv("GEMINI_API_KEY")
-
-llm = LLM(
-    model="gemini/gemini-2.0-flash",
-    api_key=gemini_api_key,
-    temperature=0.3
-)
-
-proposal_agent = Agent(
-    name="Proposal Writer",
-    role="AI strategy consultant creating executive proposals",
-    goal="Synthesize all findings into structured markdown report with clickable links",
-    backstory="12+ year consultant specializing in AI transformation proposals",
-    verbose=True,
-    memory=True,
-    tools=[file_manager_tool],
-    allow_delegation=False,
-    system_message=(
-        "EXECUTIVE AI TRANSFORMATION PROPOSAL:\n"
-        "Create a senior consultant-level report with EXACTLY this structure:\n\n"
-        "## Executive Summary\n"
-        "- Company position and AI opportunity\n"
-        "- Key recommendations (3-4 bullets)\n"
-        "- Expected business impact (quantified)\n\n"
-        "## Market Research & Industry Analysis\n"
-        "- Industry market size and CAGR\n"
-        "- AI adoption trends and maturity\n"
-        "- Competitive landscape insights\n\n"
-        "## AI Use Case Portfolio\n"
-        "- 10-12 use cases in priority order\n"
-        "- Each with: Problem, Solution, Benefits, ROI, Complexity, Example\n"
-        "- Categorized: Quick Wins / Strategic / Transformational\n\n"
-        "## Dataset & Resource Assets\n"
-        "- Public datasets by use case\n"
-        "- Pre-trained models and APIs\n"
-        "- Code repositories and tools\n\n"
-        "## Implementation Roadmap\n"
-        "- Phase 1 (0-6 months): Specific use cases to implement\n"
-        "- Phase 2 (6-18 months): Named strategic initiatives\n"
-        "- Phase 3 (18+ months): Transformational projects\n"
-        "- Resource requirements and timeline\n\n"
-        "## References\n"
-        "- All sources with clickable links\n\n"
-        "CRITICAL: Make roadmap specific - name exact use cases in each phase based on priority"
-    ),
-    llm=llm
-)
\ No newline at end of file
+from functools import lru_cache
+from crewai import Agent
+from config.llm import build_llm
+
+
+class ProposalAgent(Agent):
+    """Proposal agent whose References section is built from the cited URLs, not generated"""
+
+    append_references: bool = True
+
+    def execute_task(self, task, context=None, tools=None):
+        result = super().execute_task(task, context, tools)
+        if not self.append_references or not isinstance(result, str):
+            return result
+
+        from config.references import build_references, strip_references
+
+        # full upstream outputs, not the (possibly compacted) prompt context
+        upstream = task.context if isinstance(task.context, list) else []
+        sections = {dep.name: dep.output.raw for dep in upstream if dep.output is not None}
+        sections["proposal"] = result
+        return strip_references(result) + "\n\n" + build_references(sections)
+
+
+@lru_cache(maxsize=None)
+def _shared_resources():
+    """LLM client and tools, built once per process and shared by every run's proposal agent"""
+    from tools.filemanager_tool import file_manager_tool
+
+    # tokens are forwarded to the UI via config.streaming
+    return build_llm("proposal", stream=True), [file_manager_tool]
+
+
+def create_proposal_agent() -> Agent:
+    """A fresh proposal agent for one crew run, so concurrent runs never share agent state"""
+    llm, tools = _shared_resources()
+    return ProposalAgent(
+        append_references=os.getenv("APPEND_REFERENCES", "1") != "0",
+        name="Proposal Writer",
+        role="AI strategy consultant creating executive proposals",
+        goal="Synthesize all findings into structured markdown report with clickable links",
+        backstory="12+ year consultant specializing in AI transformation proposals",
+        verbose=True,
+        tools=list(tools),
+        allow_delegation=False,
+        system_message=(
+            "EXECUTIVE AI TRANSFORMATION PROPOSAL:\n"
+            "Create a senior consultant-level report with EXACTLY this structure:\n\n"
+            "## Executive Summary\n"
+            "- Company position and AI opportunity\n"
+            "- Key recommendations (3-4 bullets)\n"
+            "- Expected business impact (quantified)\n\n"
+            "## Market Research & Industry Analysis\n"
+            "- Industry market size and CAGR\n"
+            "- AI adoption trends and maturity\n"
+            "- Competitive landscape insights\n\n"
+            "## AI Use Case Portfolio\n"
+            "- 10-12 use cases in priority order\n"
+            "- Each with: Problem, Solution, Benefits, ROI, Complexity, Example\n"
+            "- Categorized: Quick Wins / Strategic / Transformational\n\n"
+            "## Dataset & Resource Assets\n"
+            "- Public datasets by use case\n"
+            "- Pre-trained models and APIs\n"
+            "- Code repositories and tools\n\n"
+            "## Implementation Roadmap\n"
+            "- Phase 1 (0-6 months): Specific use cases to implement\n"
+            "- Phase 2 (6-18 months): Named strategic initiatives\n"
+            "- Phase 3 (18+ months): Transformational projects\n"
+            "- Resource requirements and timeline\n\n"
+            "Cite sources inline as [Source: URL]. Do NOT write a References section; "
+            "it is appended automatically from every cited URL.\n\n"
+            "CRITICAL: Make roadmap specific - name exact use cases in each phase based on priority"
+        ),
+        llm=llm,
+    )
@@ -2,47 +2,48 @@
 AI Use Case Agent - Optimized
 """
 
-from crewai import Agent, LLM
-from tools.tavily_tool import tavily
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from crewai import Agent
+from config.llm import build_llm
 
-load_dotenv()
-gemini_api_key = os.getenv("GEMINI_API_KEY")
 
-llm = LLM(
-    model="gemini/gemini-2.0-flash",
-    api_key=gemini_api_key,
-    temperature=0.3
-)
+@lru_cache(maxsize=None)
+def _shared_resources():
+    """LLM client and tools, built once per process and shared by every run's usecase agent"""
+    from tools.tavily_tool import get_tavily_tool
 
-usecase_agent = Agent(
-    name="AI Use Case Generator",
-    role="AI solutions architect creating tailored use cases",
-    goal="Generate 10-12 prioritized AI use cases with ROI and feasibility analysis",
-    backstory="8+ year AI architect with 100+ enterprise implementations",
-    verbose=True,
-    memory=True,
-    tools=[tavily],
-    allow_delegation=False,
-    system_message=(
-        "STRATEGIC USE CASE GENERATION:\n"
-        "1. BUSINESS MODEL ALIGNMENT:\n"
-        "   - If B2C: Focus on operations, supply chain, customer experience\n"
-        "   - If B2B: Focus on AI-powered service offerings to sell to clients\n"
-        "2. GENERATE 10-12 USE CASES with this exact structure:\n"
-        "   - **Use Case Name**\n"
-        "   - Problem Statement: Specific business pain\n"
-        "   - AI Solution: Technical approach (ML/GenAI/CV/NLP)\n"
-        "   - Business Benefits: Quantified outcomes\n"
-        "   - Estimated ROI: % return or $ savings annually\n"
-        "   - Complexity: Low/Medium/High with justification\n"
-        "   - Industry Example: Real company implementation\n"
-        "3. PRIORITIZATION MATRIX:\n"
-        "   - Quick Wins: High ROI + Low Complexity\n"
-        "   - Strategic Initiatives: Core business impact\n"
-        "   - Transformational: Long-term game-changers\n"
-        "Cover: Predictive Analytics, NLP/GenAI, Computer Vision, Automation"
-    ),
-    llm=llm
-)
\ No newline at end of file
+    return build_llm("usecase"), [get_tavily_tool()]
+
+
+def create_usecase_agent() -> Agent:
+    """A fresh usecase agent for one crew run, so concurrent runs never share agent state"""
+    llm, tools = _shared_resources()
+    return Agent(
+        name="AI Use Case Generator",
+        role="AI solutions architect creating tailored use cases",
+        goal="Generate 10-12 prioritized AI use cases with ROI and feasibility analysis",
+        backstory="8+ year AI architect with 100+ enterprise implementations",
+        verbose=True,
+        tools=list(tools),
+        allow_delegation=False,
+        system_message=(
+            "STRATEGIC USE CASE GENERATION:\n"
+            "1. BUSINESS MODEL ALIGNMENT:\n"
+            "   - If B2C: Focus on operations, supply chain, customer experience\n"
+            "   - If B2B: Focus on AI-powered service offerings to sell to clients\n"
+            "2. GENERATE 10-12 USE CASES with this exact structure:\n"
+            "   - **Use Case Name**\n"
+            "   - Problem Statement: Specific business pain\n"
+            "   - AI Solution: Technical approach (ML/GenAI/CV/NLP)\n"
+            "   - Business Benefits: Quantified outcomes\n"
+            "   - Estimated ROI: % return or $ savings annually\n"
+            "   - Complexity: Low/Medium/High with justification\n"
+            "   - Industry Example: Real company implementation\n"
+            "3. PRIORITIZATION MATRIX:\n"
+            "   - Quick Wins: High ROI + Low Complexity\n"
+            "   - Strategic Initiatives: Core business impact\n"
+            "   - Transformational: Long-term game-changers\n"
+            "Cover: Predictive Analytics, NLP/GenAI, Computer Vision, Automation"
+        ),
+        llm=llm
+    )
@@ -0,0 +1,153 @@
+"""
+Batch Analysis Runner - Generates proposals for many companies with a bounded worker pool
+
+Usage:
+    python batch.py companies.csv --workers 4
+    python batch.py companies.jsonl --workers 8 --force
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+from utils import company_slug
+
+OUTPUT_DIR = "outputs"
+
+
+def load_companies(path: str) -> List[str]:
+    """Read company names from a CSV (`company` or `name` column, else the first column) or JSONL file"""
+    companies = []
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    companies.append(record.get("company") or record.get("name") or "")
+        else:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            lowered = [h.strip().lower() for h in header]
+            named = [lowered.index(key) for key in ("company", "name") if key in lowered]
+            column = named[0] if named else 0
+            if not named and header:
+                # no header row: the first line is already a company
+                companies.append(header[column])
+            for row in reader:
+                if row:
+                    companies.append(row[column])
+
+    # drop blanks and duplicates that would map to the same artifacts
+    unique = {}
+    for name in companies:
+        name = " ".join(name.split())
+        if name and company_slug(name) not in unique:
+            unique[company_slug(name)] = name
+    return list(unique.values())
+
+
+def load_industries(path: str) -> Dict[str, str]:
+    """Optional `industry` column/field per company, so a vertical shares one industry analysis"""
+    industries = {}
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()] if path.endswith(".jsonl") else csv.DictReader(f)
+        for record in records:
+            record = {str(k).strip().lower(): v for k, v in record.items() if k}
+            company, industry = record.get("company") or record.get("name"), record.get("industry")
+            if company and industry and industry.strip():
+                industries[company_slug(" ".join(company.split()))] = industry.strip()
+    return industries
+
+
+def is_completed(company: str) -> bool:
+    proposal = os.path.join(OUTPUT_DIR, f"{company_slug(company)}_proposal.md")
+    return os.path.exists(proposal) and os.path.getsize(proposal) > 0
+
+
+def analyze_company(company: str, industry: str = None) -> Dict:
+    """Run one crew in a worker process; artifacts are written to outputs/ by the tasks"""
+    from config.crew import create_ai_usecase_crew
+
+    started = time.time()
+    try:
+        create_ai_usecase_crew(company, industry=industry).kickoff()
+        return {"company": company, "status": "completed", "duration": time.time() - started}
+    except Exception as e:
+        return {"company": company, "status": "failed", "duration": time.time() - started, "error": str(e)}
+
+
+def run_batch(companies: List[str], workers: int, force: bool = False, industries: Dict[str, str] = None) -> List[Dict]:
+    results = []
+    pending = []
+    for company in companies:
+        if not force and is_completed(company):
+            results.append({"company": company, "status": "skipped", "duration": 0.0})
+        else:
+            pending.append(company)
+
+    print(f"📋 {len(companies)} companies: {len(pending)} to run, {len(results)} already completed")
+
+    # separate processes keep each crew's agents and memory isolated
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(analyze_company, company, (industries or {}).get(company_slug(company))): company
+            for company in pending
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"company": futures[future], "status": "failed", "duration": 0.0, "error": str(e)}
+            results.append(result)
+            icon = "✅" if result["status"] == "completed" else "❌"
+            print(f"{icon} {result['company']} ({result['duration']:.1f}s)")
+
+    return results
+
+
+def write_summary(results: List[Dict], path: str) -> None:
+    completed = [r for r in results if r["status"] == "completed"]
+    failed = [r for r in results if r["status"] == "failed"]
+    skipped = [r for r in results if r["status"] == "skipped"]
+
+    print("\n" + "=" * 50)
+    print(f"✅ Completed: {len(completed)}  ❌ Failed: {len(failed)}  ⏭️ Skipped: {len(skipped)}")
+    for r in sorted(completed, key=lambda r: r["duration"], reverse=True):
+        print(f"  {r['company']}: {r['duration']:.1f}s")
+    for r in failed:
+        print(f"  ❌ {r['company']}: {r.get('error', 'unknown error')}")
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"results": results, "generated_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+    print(f"📝 Summary written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate AI use case proposals for many companies")
+    parser.add_argument("input", help="CSV or JSONL file with company names")
+    parser.add_argument("--workers", type=int, default=4, help="maximum concurrent crews")
+    parser.add_argument("--force", action="store_true", help="re-run companies that already have a proposal")
+    parser.add_argument("--summary", default=os.path.join(OUTPUT_DIR, "batch_summary.json"))
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    companies = load_companies(args.input)
+    if not companies:
+        print("❌ No company names found in input")
+        sys.exit(1)
+
+    results = run_batch(companies, max(1, args.workers), args.force, load_industries(args.input))
+    write_summary(results, args.summary)
+    if any(r["status"] == "failed" for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Offline End-to-End Benchmark - Full crew runs against a fake LLM and local stub APIs
+
+Every scenario runs `create_ai_usecase_crew(...).kickoff()` in a fresh interpreter inside a
+temporary directory, so caches, checkpoints and outputs never leak between runs.
+
+Usage:
+    python benchmarks/e2e.py --save-baseline      # record current numbers as the new baseline
+    python benchmarks/e2e.py                      # run all scenarios, compare with baselines
+    python benchmarks/e2e.py --scenario cold      # one scenario
+
+Timings depend on the machine, so no baselines are committed: record them once on the
+machine that will run the comparison (a scenario without one is only reported).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DIR = os.path.join(ROOT, "benchmarks", "baselines")
+
+SCENARIOS = {
+    # no caches, modest API and LLM latency
+    "cold": {"company": "Acme Retail", "api_latency": 0.05, "llm_latency": 0.05, "cache": False, "runs": 1},
+    # slow APIs, where overlapping research branches and tool calls matters most
+    "slow-apis": {"company": "Acme Retail", "api_latency": 0.5, "llm_latency": 0.05, "cache": False, "runs": 1},
+    # second run of the same company with HTTP and LLM caches on (checkpoints off)
+    "warm-cache": {"company": "Acme Retail", "api_latency": 0.05, "llm_latency": 0.05, "cache": True, "runs": 2},
+}
+
+
+def run_worker(scenario: dict) -> dict:
+    """Executed inside the child interpreter: one or more crew runs, metrics of the last one"""
+    import resource
+    import tracemalloc
+
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    import config.llm
+    from fake_llm import FakeLLM
+
+    fakes = []
+
+    def fake_factory(temperature, model, **kwargs):
+        fake = FakeLLM(temperature=temperature, latency=scenario["llm_latency"])
+        fakes.append(fake)
+        return config.llm.CachedLLM(fake) if scenario["cache"] else fake
+
+    config.llm.use_llm_factory(fake_factory)
+    from config.crew import create_ai_usecase_crew
+
+    for _ in range(scenario["runs"]):
+        finished = {}
+        tracemalloc.start()
+        started = time.perf_counter()
+        crew = create_ai_usecase_crew(
+            scenario["company"],
+            resume=False,
+            progress_callback=lambda stage, raw: finished.setdefault(stage, time.perf_counter() - started),
+        )
+        llm_calls_before = sum(f.stats["calls"] for f in fakes)
+        tool_calls_before = {}
+        for fake in fakes:
+            for name, count in fake.tool_calls.items():
+                tool_calls_before[name] = tool_calls_before.get(name, 0) + count
+
+        crew.kickoff()
+        wall_time = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # a stage starts once all of its context dependencies have finished
+    stages = {}
+    for task in crew.tasks:
+        upstream = task.context if isinstance(task.context, list) else []
+        start = max((finished.get(dep.name, 0.0) for dep in upstream), default=0.0)
+        end = finished.get(task.name, wall_time)
+        stages[task.name] = {"start": round(start, 3), "end": round(end, 3), "duration": round(end - start, 3)}
+
+    tool_calls = {}
+    for fake in fakes:
+        for name, count in fake.tool_calls.items():
+            tool_calls[name] = tool_calls.get(name, 0) + count
+    tool_calls = {name: count - tool_calls_before.get(name, 0) for name, count in tool_calls.items()}
+
+    return {
+        "wall_time": round(wall_time, 3),
+        "stages": stages,
+        "llm_calls": sum(f.stats["calls"] for f in fakes) - llm_calls_before,
+        "tool_calls": {k: v for k, v in tool_calls.items() if v},
+        "peak_traced_mb": round(peak / 1024 / 1024, 2),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_scenario(name: str, scenario: dict, server) -> dict:
+    server.latency = {"default": scenario["api_latency"]}
+    server.requests.clear()
+    env = {
+        **os.environ,
+        **server.env(),
+        "GEMINI_API_KEY": "offline-benchmark",
+        "TAVILY_API_KEY": "offline-benchmark",
+        "HTTP_CACHE": "1" if scenario["cache"] else "0",
+        "LLM_CACHE": "on" if scenario["cache"] else "off",
+        "HTTP_MAX_RETRIES": "0",
+        # the stubs have no quota; throttling would only distort timings
+        "RATE_LIMIT": "0",
+        # fake answers cite placeholder URLs; offline runs skip the HEAD checks
+        "LINK_CHECK": "0",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+    }
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as workdir:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", json.dumps(scenario)],
+            cwd=workdir, env=env, capture_output=True, text=True,
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"scenario {name} failed:\n{proc.stderr[-2000:]}")
+
+    metrics = json.loads(proc.stdout.strip().splitlines()[-1])
+    metrics["http_requests"] = dict(server.requests)
+    return metrics
+
+
+def compare(name: str, metrics: dict, tolerance: float) -> list:
+    """Return regressions against the stored baseline (slower, more calls, more memory)"""
+    path = os.path.join(BASELINE_DIR, f"{name}.json")
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    checks = {
+        "wall_time": (baseline["wall_time"], metrics["wall_time"]),
+        "llm_calls": (baseline["llm_calls"], metrics["llm_calls"]),
+        "http_requests": (sum(baseline["http_requests"].values()), sum(metrics["http_requests"].values())),
+        "peak_traced_mb": (baseline["peak_traced_mb"], metrics["peak_traced_mb"]),
+    }
+    for stage, values in metrics["stages"].items():
+        if stage in baseline["stages"]:
+            checks[f"stage:{stage}"] = (baseline["stages"][stage]["duration"], values["duration"])
+
+    regressions = []
+    for metric, (before, after) in checks.items():
+        # ignore sub-50ms jitter on timings
+        if after > before * (1 + tolerance) and after - before > 0.05:
+            regressions.append(f"{metric}: {before} → {after}")
+    return regressions
+
+
+def report(name: str, metrics: dict) -> None:
+    print(f"\n▶ {name}: {metrics['wall_time']:.2f}s wall, {metrics['llm_calls']} LLM calls, "
+          f"peak {metrics['peak_traced_mb']} MB traced / {metrics['max_rss_mb']} MB RSS")
+    for stage, values in metrics["stages"].items():
+        print(f"  {stage:<28} {values['start']:>7.2f}s → {values['end']:>7.2f}s  ({values['duration']:.2f}s)")
+    print(f"  tool calls:    {metrics['tool_calls']}")
+    print(f"  HTTP requests: {metrics['http_requests']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(json.loads(args.worker))))
+        return
+
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from stub_server import StubServer
+
+    server = StubServer().start()
+    failed = False
+    try:
+        for name in args.scenario or SCENARIOS:
+            metrics = run_scenario(name, SCENARIOS[name], server)
+            report(name, metrics)
+            if args.save_baseline:
+                os.makedirs(BASELINE_DIR, exist_ok=True)
+                with open(os.path.join(BASELINE_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+                    json.dump(metrics, f, indent=2)
+                print("  📝 baseline saved")
+                continue
+            if not os.path.exists(os.path.join(BASELINE_DIR, f"{name}.json")):
+                print("  ⚠️ no baseline to compare against; run with --save-baseline first")
+                continue
+            regressions = compare(name, metrics, args.tolerance)
+            for regression in regressions:
+                print(f"  ❌ regression {regression}")
+            failed = failed or bool(regressions)
+    finally:
+        server.stop()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
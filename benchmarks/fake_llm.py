@@ -0,0 +1,113 @@
+"""
+Fake LLM - Deterministic stand-in for Gemini that speaks crewai's ReAct format
+
+On an agent's first turn it calls one of the offered search tools, then returns a
+Final Answer built from the task text, so runs exercise tools without any API key.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+
+from crewai.llms.base_llm import BaseLLM
+
+TOOL_LIST_RE = re.compile(r"only one name of \[(.*?)\]")
+TASK_RE = re.compile(r"Current Task:\s*(.+)")
+
+
+def _text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(m.get("content", "")) for m in messages)
+
+
+class FakeLLM(BaseLLM):
+    """Deterministic LLM with optional per-call latency and call/tool counters"""
+
+    def __init__(self, model: str = "fake/deterministic", temperature: float = 0.0, latency: float = 0.0,
+                 answer_lines: int = 40, **kwargs):
+        super().__init__(model=model, temperature=temperature)
+        self.latency = latency
+        self.answer_lines = answer_lines
+        # counters are shared objects so shallow agent copies (research branches) report into them
+        self.stats = Counter()
+        self.tool_calls = Counter()
+        self._lock = threading.Lock()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        text = _text(messages)
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["prompt_chars"] += len(text)
+        if self.latency:
+            time.sleep(self.latency)
+
+        task_match = TASK_RE.search(text)
+        task_line = task_match.group(1).strip() if task_match else "AI strategy"
+        has_observation = not isinstance(messages, str) and any(m.get("role") == "assistant" for m in messages)
+
+        tool_match = TOOL_LIST_RE.search(text)
+        if tool_match and not has_observation:
+            # file writes would touch outputs/; only search tools are exercised
+            names = [n.strip() for n in tool_match.group(1).split(",") if "file" not in n.lower()]
+            if names:
+                tool = names[0]
+                with self._lock:
+                    self.tool_calls[tool] += 1
+                query = " ".join(task_line.split()[:6]).replace('"', "")
+                # batch tools take a list of queries
+                action_input = f'{{"queries": ["{query}", "{query} model"]}}' if "batch" in tool.lower() else f'{{"query": "{query}"}}'
+                return (
+                    "Thought: I should gather supporting data first.\n"
+                    f"Action: {tool}\n"
+                    f"Action Input: {action_input}"
+                )
+
+        answer = self.answer(task_line)
+        if "use-case JSON block" in text:
+            answer += "\n\n" + self.portfolio(task_line)
+        return "Thought: I now know the final answer\nFinal Answer: " + answer
+
+    def answer(self, task_line: str) -> str:
+        """Markdown with headings, figures and links, stable for a given task"""
+        seed = int(hashlib.sha256(task_line.encode("utf-8")).hexdigest()[:8], 16)
+        lines = [f"# {task_line[:80]}", ""]
+        for i in range(self.answer_lines):
+            n = (seed >> (i % 24)) % 97 + i
+            if i % 8 == 0:
+                lines.append(f"## Section {i // 8 + 1}")
+            lines.append(
+                f"- **Item {i + 1}**: estimated ROI {n}% with market size ${n * 1.7:.1f}B "
+                f"[Source](https://example.com/report/{seed % 1000}/{i})"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def portfolio(task_line: str, count: int = 10) -> str:
+        """A use case JSON block (config/usecases.py schema) stable for a given task"""
+        categories = ["Quick Win", "Strategic Initiative", "Transformational"]
+        topics = ["demand forecasting", "customer churn", "fraud detection", "document summarization",
+                  "defect detection", "price optimization", "support chatbot", "supply chain"]
+        use_cases = [
+            {
+                "name": f"{topics[i % len(topics)].title()} {i + 1}",
+                "category": categories[i % 3],
+                "domain_keywords": topics[i % len(topics)].split() + [task_line.split()[0].lower()],
+                "roi": f"{10 + i}% cost reduction",
+                "complexity": ["Low", "Medium", "High"][i % 3],
+            }
+            for i in range(count)
+        ]
+        return "```json\n" + json.dumps({"use_cases": use_cases}) + "\n```"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return True
+
+    def get_context_window_size(self) -> int:
+        return 1_000_000
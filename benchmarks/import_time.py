@@ -0,0 +1,80 @@
+"""
+Import-Time Benchmark - Cold-start cost of the Streamlit entry point vs eager crew construction
+
+Usage:
+    python benchmarks/import_time.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    # what `streamlit run main.py` pays before the first page render
+    "main (lazy)": "import main",
+    "config.crew": "import config.crew",
+    # the old import-time behaviour: every agent, LLM and tool built up front
+    "eager agents": (
+        "from agents.research_agent import create_research_agent\n"
+        "from agents.usecase_agent import create_usecase_agent\n"
+        "from agents.dataset_agent import create_dataset_agent\n"
+        "from agents.proposal_agent import create_proposal_agent\n"
+        "create_research_agent(); create_usecase_agent(); create_dataset_agent(); create_proposal_agent()"
+    ),
+}
+
+
+def time_snippet(code: str) -> float:
+    """Wall time of a fresh interpreter running `code`, so nothing is already imported"""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "TAVILY_API_KEY": os.getenv("TAVILY_API_KEY", "bench")}
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+    return elapsed
+
+
+def slowest_imports(code: str, top: int) -> list:
+    """Top cumulative entries from `python -X importtime`"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:   self_us |   cumulative_us | module"
+        _, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="show the N slowest imports of main")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16} {'median':>9} {'min':>9}")
+    for label, code in SCENARIOS.items():
+        try:
+            samples = [time_snippet(code) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{label:<16} failed: {e}")
+            continue
+        print(f"{label:<16} {statistics.median(samples):>8.2f}s {min(samples):>8.2f}s")
+
+    if args.top:
+        print("\nSlowest imports for `import main` (cumulative):")
+        for cumulative_us, name in slowest_imports(SCENARIOS["main (lazy)"], args.top):
+            print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
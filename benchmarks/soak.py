@@ -0,0 +1,137 @@
+"""
+Soak Benchmark - Hundreds of crew runs in one process, checking that resident memory stays flat
+
+Runs use the fake LLM and local stub APIs (like benchmarks/e2e.py), several crews at a time,
+so leaks in per-run agent state, traces or caches show up as RSS growth.
+
+Usage:
+    python benchmarks/soak.py                          # 200 runs, 4 concurrent
+    python benchmarks/soak.py --runs 500 --concurrency 8 --max-growth-mb 40
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_mb() -> float:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(options: dict) -> None:
+    """Executed inside the child interpreter: prints one JSON sample per checkpoint"""
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    import config.llm
+    from fake_llm import FakeLLM
+
+    config.llm.use_llm_factory(lambda temperature, model, **kwargs: FakeLLM(temperature=temperature))
+    from config.crew import create_ai_usecase_crew
+    from tools.tracing import tracer
+
+    def one_run(i: int) -> None:
+        # a handful of companies, so on-disk artifacts stop growing while runs go on
+        crew = create_ai_usecase_crew(f"Soak Company {i % options['companies']}", resume=False)
+        crew.kickoff()
+
+    every = max(1, options["runs"] // 20)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+        for done, _ in enumerate(executor.map(one_run, range(options["runs"])), start=1):
+            if done % every == 0 or done == options["runs"]:
+                gc.collect()
+                print(json.dumps({
+                    "runs": done,
+                    "rss_mb": round(rss_mb(), 1),
+                    "spans": len(tracer.spans),
+                    "objects": len(gc.get_objects()),
+                    "elapsed": round(time.perf_counter() - started, 1),
+                }), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check for memory growth over many crew runs")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--max-growth-mb", type=float, default=50.0,
+                        help="allowed RSS growth after the first 25%% of runs (warm-up)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(json.loads(args.worker))
+        return
+
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from stub_server import StubServer
+
+    server = StubServer().start()
+    env = {
+        **os.environ,
+        **server.env(),
+        "GEMINI_API_KEY": "offline-benchmark",
+        "TAVILY_API_KEY": "offline-benchmark",
+        "LLM_CACHE": "off",
+        "HTTP_MAX_RETRIES": "0",
+        # the stubs have no quota; throttling would only distort timings
+        "RATE_LIMIT": "0",
+        # fake answers cite placeholder URLs; offline runs skip the HEAD checks
+        "LINK_CHECK": "0",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+    }
+    options = {"runs": args.runs, "concurrency": args.concurrency, "companies": args.companies}
+    samples = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-soak-") as workdir:
+            proc = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--worker", json.dumps(options)],
+                # crew logs are verbose; merging stderr keeps either pipe from filling up
+                cwd=workdir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+            )
+            tail = deque(maxlen=40)
+            for line in proc.stdout:
+                tail.append(line)
+                try:
+                    sample = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(sample, dict) or "rss_mb" not in sample:
+                    continue
+                samples.append(sample)
+                print(f"  {sample['runs']:>5} runs  {sample['rss_mb']:>8.1f} MB RSS  "
+                      f"{sample['spans']:>6} spans  {sample['objects']:>9} objects  {sample['elapsed']:>7.1f}s")
+            if proc.wait() != 0 or not samples:
+                raise RuntimeError("soak worker failed:\n" + "".join(tail))
+    finally:
+        server.stop()
+
+    warm = next(s for s in samples if s["runs"] >= args.runs * 0.25)
+    growth = samples[-1]["rss_mb"] - warm["rss_mb"]
+    print(f"\n📈 RSS {warm['rss_mb']} MB after {warm['runs']} runs → {samples[-1]['rss_mb']} MB after "
+          f"{samples[-1]['runs']} runs ({growth:+.1f} MB)")
+    if growth > args.max_growth_mb:
+        print(f"❌ memory grew more than {args.max_growth_mb} MB")
+        sys.exit(1)
+    print("✅ memory flat")
+
+
+if __name__ == "__main__":
+    main()
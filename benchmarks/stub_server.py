@@ -0,0 +1,185 @@
+"""
+Stub API Server - Local stand-ins for the Tavily, GitHub, Kaggle and HuggingFace endpoints
+
+Each provider lives under its own path prefix so the tools can be pointed at it with
+TAVILY_API_URL, GITHUB_API_URL, KAGGLE_API_URL and HUGGINGFACE_API_URL.
+
+Usage:
+    python benchmarks/stub_server.py --port 8765 --latency 0.2
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+
+def _slug(text: str) -> str:
+    return "-".join(text.lower().split())[:40] or "query"
+
+
+def tavily_search(query: str) -> Dict:
+    return {
+        "query": query,
+        "results": [
+            {
+                "title": f"{query} market report {i}",
+                "url": f"https://news.example.com/{_slug(query)}/{i}",
+                "content": f"The {query} market reached ${12 + i}.4B in 2024 growing at {8 + i}% CAGR.",
+                "score": 0.9 - i * 0.1,
+            }
+            for i in range(5)
+        ],
+    }
+
+
+def github_search(query: str) -> Dict:
+    return {
+        "total_count": 3,
+        "items": [
+            {
+                "name": f"{_slug(query)}-{i}",
+                "html_url": f"https://github.com/example/{_slug(query)}-{i}",
+                "stargazers_count": 1500 - i * 400,
+                "description": f"Reference implementation for {query}",
+                "updated_at": "2024-06-01T00:00:00Z",
+                "size": 2048 * (i + 1),
+            }
+            for i in range(3)
+        ],
+    }
+
+
+def kaggle_search(query: str) -> list:
+    # shaped like real /datasets/list items, which include "url"
+    return [
+        {
+            "title": f"{query.title()} Dataset {i}",
+            "ref": f"example/{_slug(query)}-{i}",
+            "url": f"https://www.kaggle.com/datasets/example/{_slug(query)}-{i}",
+            "subtitle": f"Labelled {query} records for modelling",
+            "size": f"{10 * (i + 1)} MB",
+            "totalBytes": 10 * (i + 1) * 1024 * 1024,
+            "lastUpdated": f"2024-0{i + 1}-15T00:00:00Z",
+            "downloadCount": 5000 - i * 1000,
+            "licenses": [{"name": "CC0-1.0"}],
+        }
+        for i in range(3)
+    ]
+
+
+def huggingface_search(query: str) -> list:
+    return [
+        {"id": f"example/{_slug(query)}-{i}", "description": f"{query} corpus split {i}", "downloads": 900 - i}
+        for i in range(3)
+    ]
+
+
+class _Server(ThreadingHTTPServer):
+    # the default backlog of 5 stalls bursts of concurrent connections on SYN retries
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class StubServer:
+    """Threaded stub server that counts requests per provider and adds configurable latency"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: Dict[str, float] = None):
+        self.latency = latency or {}
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self.httpd = _Server((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        """Environment that points every tool at this server"""
+        return {
+            "TAVILY_API_URL": f"{self.base_url}/tavily",
+            "GITHUB_API_URL": f"{self.base_url}/github",
+            "KAGGLE_API_URL": f"{self.base_url}/kaggle",
+            "HUGGINGFACE_API_URL": f"{self.base_url}/huggingface",
+        }
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._dispatch()
+
+            def do_POST(self):
+                self._dispatch()
+
+            def _dispatch(self):
+                parts = urlsplit(self.path)
+                params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                body = {}
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+
+                provider, _, route = parts.path.strip("/").partition("/")
+                routes = {
+                    ("tavily", "search"): lambda: tavily_search(body.get("query", "")),
+                    ("github", "search/repositories"): lambda: github_search(params.get("q", "")),
+                    ("kaggle", "datasets/list"): lambda: kaggle_search(params.get("search", "")),
+                    ("huggingface", "datasets"): lambda: huggingface_search(params.get("search", "")),
+                }
+                handler = routes.get((provider, route))
+                if handler is None:
+                    self.send_error(404)
+                    return
+
+                with server._lock:
+                    server.requests[provider] += 1
+                time.sleep(server.latency.get(provider, server.latency.get("default", 0.0)))
+
+                payload = json.dumps(handler()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the stub API server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    server = StubServer(port=args.port, latency={"default": args.latency}).start()
+    for key, value in server.env().items():
+        print(f"export {key}={value}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Stage Checkpoints - Reuse finished task outputs when their inputs have not changed
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils import company_slug
+
+
+class CheckpointStore:
+    """
+    Per-company manifest of finished stages under outputs/.checkpoints/.
+
+    Each stage is fingerprinted from its prompt, agent, model, temperature and the
+    outputs it consumed, so a checkpoint is only reused when re-running it would
+    see exactly the same inputs.
+    """
+
+    def __init__(self, company_name: str, directory: str = os.path.join("outputs", ".checkpoints")):
+        self.directory = os.path.join(directory, company_slug(company_name))
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self._lock = threading.Lock()
+        self.manifest: Dict[str, Dict] = self._load_manifest()
+
+    @staticmethod
+    def fingerprint(task, upstream_outputs: List[str]) -> str:
+        agent = task.agent
+        llm = getattr(agent, "llm", None)
+        parts = {
+            "description": task.description,
+            "expected_output": task.expected_output,
+            "role": getattr(agent, "role", None),
+            "goal": getattr(agent, "goal", None),
+            "system_message": getattr(agent, "system_message", None),
+            "model": getattr(llm, "model", None),
+            "temperature": getattr(llm, "temperature", None),
+            "context_budget": getattr(task, "context_budget", None),
+            "upstream": [hashlib.sha256(raw.encode("utf-8")).hexdigest() for raw in upstream_outputs],
+        }
+        if getattr(task, "context_seeder", None):
+            parts["warm_start"] = True
+        if hasattr(agent, "fanout"):
+            # the dataset stage answers from the portfolio fan-out or the LLM tool loop
+            parts["fanout"] = agent.fanout
+        encoded = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def load(self, stage: str, fingerprint: str) -> Optional[str]:
+        entry = self.manifest.get(stage)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        path = os.path.join(self.directory, f"{stage}.md")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def save(self, stage: str, fingerprint: str, raw: str) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f"{stage}.md"), "w", encoding="utf-8", newline="\n") as f:
+                f.write(raw)
+            self.manifest[stage] = {
+                "fingerprint": fingerprint,
+                "completed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            tmp_path = self.manifest_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.manifest = {}
+            if os.path.exists(self.manifest_path):
+                os.remove(self.manifest_path)
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
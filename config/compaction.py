@@ -0,0 +1,86 @@
+"""
+Context Compaction - Shrinks upstream reports to a fact-dense digest before synthesis
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+URL_RE = re.compile(r"https?://[^\s)\]>]+")
+NUMBER_RE = re.compile(r"\d")
+KEY_FIELDS = ("roi", "complexity", "category", "quick win", "strategic", "transformational", "b2b", "b2c")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting"""
+    return (len(text) + 3) // 4
+
+
+def _score(line: str) -> int:
+    """How much a line is worth keeping: structure, links, numbers and named items first"""
+    stripped = line.strip()
+    if not stripped:
+        return -1
+    if stripped.startswith("#"):
+        return 4
+    score = 0
+    if URL_RE.search(stripped):
+        score += 3
+    if NUMBER_RE.search(stripped):
+        score += 2
+    if "**" in stripped:
+        score += 2
+    lowered = stripped.lower()
+    if any(field in lowered for field in KEY_FIELDS):
+        score += 1
+    return score
+
+
+def compact_text(text: str, budget_tokens: int, max_line_chars: int = 300) -> str:
+    """Keep headings and lines with facts, numbers or URLs, dropping the weakest lines until under budget"""
+    lines: List[Tuple[int, int, str]] = []
+    for index, line in enumerate(text.splitlines()):
+        score = _score(line)
+        if score <= 0:
+            continue
+        line = line.rstrip()
+        if len(line) > max_line_chars:
+            # keep the URLs even when the prose around them is cut
+            urls = " ".join(u for u in URL_RE.findall(line) if u not in line[:max_line_chars])
+            line = line[:max_line_chars].rstrip() + "…" + (f" {urls}" if urls else "")
+        lines.append((index, score, line))
+
+    total = sum(estimate_tokens(line) + 1 for _, _, line in lines)
+    if total > budget_tokens:
+        # drop lowest-scoring lines first, later lines before earlier ones; only headings are kept regardless
+        for entry in sorted(lines, key=lambda e: (e[1], -e[0])):
+            if total <= budget_tokens:
+                break
+            if entry[2].lstrip().startswith("#"):
+                continue
+            lines.remove(entry)
+            total -= estimate_tokens(entry[2]) + 1
+
+    return "\n".join(line for _, _, line in lines)
+
+
+def build_digest(sections: Dict[str, str], budget_tokens: int) -> Tuple[str, Dict]:
+    """
+    Compact each named section within a share of the budget proportional to its size.
+
+    Returns the digest and metrics with token counts before and after.
+    """
+    sizes = {name: estimate_tokens(text) for name, text in sections.items()}
+    total_before = sum(sizes.values()) or 1
+    digest_parts = []
+    metrics = {"budget_tokens": budget_tokens, "tokens_before": 0, "tokens_after": 0, "sections": {}}
+
+    for name, text in sections.items():
+        share = max(200, budget_tokens * sizes[name] // total_before)
+        compacted = compact_text(text, share) if sizes[name] > share else text
+        digest_parts.append(f"## {name}\n{compacted}")
+        metrics["sections"][name] = {"tokens_before": sizes[name], "tokens_after": estimate_tokens(compacted)}
+
+    digest = "\n\n".join(digest_parts)
+    metrics["tokens_before"] = sum(sizes.values())
+    metrics["tokens_after"] = estimate_tokens(digest)
+    return digest, metrics
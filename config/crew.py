@@ -2,60 +2,279 @@
 Crew Configuration
 """
 
+import json
 import os
-from crewai import Crew, Process, LLM
-from agents.research_agent import research_agent
-from agents.usecase_agent import usecase_agent
-from agents.dataset_agent import dataset_agent
-from agents.proposal_agent import proposal_agent
+import uuid
+from functools import partial
+from crewai import Crew, Process
+from crewai.crews.crew_output import CrewOutput
+from crewai.tasks.task_output import TaskOutput
+from agents.research_agent import create_research_agent
+from agents.usecase_agent import create_usecase_agent
+from agents.dataset_agent import create_dataset_agent
+from agents.proposal_agent import create_proposal_agent
 from config.tasks import TaskConfig
+from config.scheduler import build_waves, schedule_tasks
+from config.checkpoints import CheckpointStore
+from config.llm import build_llm, llm_cache_mode
+from config.compaction import build_digest, compact_text
+from config.similarity import similarity_index
+from config import industry as industry_knowledge
+from tools.tracing import tracer
+from utils import company_slug
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class AIUseCaseGenerationCrew:
-    def __init__(self, company):
+    def __init__(self, company, parallel_research: bool = True, resume: bool = True,
+                 progress_callback=None, compact_context: bool = None, context_budget: int = None,
+                 warm_start: bool = None, seed_budget: int = None, industry: str = None):
         self.company = company
+        self.progress_callback = progress_callback
+        self.compaction_metrics = None
+        self._trace_summary = None
+        self.run_id = uuid.uuid4().hex[:12]
         self.task_config = TaskConfig()
+        self.checkpoints = CheckpointStore(company)
+        self.restored = set()
+        self.shared = set()
 
-        self.research_task = self.task_config.create_research_task(research_agent, company)
-        self.usecase_task = self.task_config.create_usecase_task(usecase_agent, company)
-        self.dataset_task = self.task_config.create_dataset_task(dataset_agent, company)
-        self.proposal_task = self.task_config.create_proposal_task(proposal_agent, company)
+        # industry research is shared across companies, which needs the branches split out
+        self.industry = None
+        self._classify_pending = False
+        if parallel_research and industry_knowledge.industry_cache.enabled:
+            if industry:
+                # explicit labels share entries with classified ones where they name the same sector
+                self.industry = industry_knowledge.normalize_industry(industry) or industry.strip()
+            else:
+                # an unknown company is classified in kickoff, only if its industry branch has to run
+                self.industry = industry_knowledge.known_industry(company)
+                self._classify_pending = self.industry is None
 
-        self.usecase_task.context = [self.research_task]
+        if parallel_research:
+            self.research_tasks = self.task_config.create_research_subtasks(
+                create_research_agent(), company, industry=self.industry
+            )
+        else:
+            self.research_tasks = [self.task_config.create_research_task(create_research_agent(), company)]
+        self.usecase_task = self.task_config.create_usecase_task(create_usecase_agent(), company)
+        self.dataset_task = self.task_config.create_dataset_task(create_dataset_agent(), company)
+        self.proposal_task = self.task_config.create_proposal_task(create_proposal_agent(), company)
+
+        self.usecase_task.context = list(self.research_tasks)
         self.dataset_task.context = [self.usecase_task]
         self.proposal_task.context = [
-            self.research_task, self.usecase_task, self.dataset_task
+            *self.research_tasks, self.usecase_task, self.dataset_task
         ]
 
+        if compact_context is None:
+            compact_context = os.getenv("COMPACT_CONTEXT", "0") == "1"
+        if compact_context:
+            self.proposal_task.context_budget = context_budget or int(os.getenv("CONTEXT_BUDGET_TOKENS", "6000"))
+            self.proposal_task.context_compactor = self._compact_context
+
+        if warm_start is None:
+            warm_start = os.getenv("WARM_START", "1") == "1"
+        if warm_start:
+            self.seed_budget = seed_budget or int(os.getenv("SEED_BUDGET_TOKENS", "1500"))
+            self.seed_neighbors = int(os.getenv("SEED_NEIGHBORS", "2"))
+            self.usecase_task.context_seeder = self._seed_context
+
+        for task in self.tasks:
+            task.run_id = self.run_id
+
+        self._restore_checkpoints(resume)
+
+    @property
+    def tasks(self):
+        return [*self.research_tasks, self.usecase_task, self.dataset_task, self.proposal_task]
+
+    @property
+    def pending_tasks(self):
+        """Tasks that still need to run after checkpoint restore"""
+        return [t for t in self.tasks if id(t) not in self.restored]
+
+    def _restore_checkpoints(self, resume: bool):
+        """
+        Reuse stage outputs whose fingerprint still matches, and the industry branch from the
+        industry cache; everything downstream of a miss re-runs
+        """
+        for task in [t for wave in build_waves(self.tasks) for t in wave]:
+            callback = task.callback
+            task.callback = partial(self._on_task_done, task, callback)
+
+            raw = None
+            upstream = task.context if isinstance(task.context, list) else []
+            if resume and all(id(dep) in self.restored for dep in upstream):
+                fingerprint = self.checkpoints.fingerprint(task, [dep.output.raw for dep in upstream])
+                raw = self.checkpoints.load(task.name, fingerprint)
+            if raw is None and task.name == "research_industry":
+                self._reuse_industry_research(task)
+            elif raw is not None:
+                self._restore(task, raw)
+
+    def _reuse_industry_research(self, task) -> None:
+        """Restore the industry branch from research another company in the same sector already paid for"""
+        raw = industry_knowledge.load_research(self.industry, task) if self.industry else None
+        if raw is not None:
+            print(f"📚 Reusing cached {self.industry} industry research")
+            self.shared.add(id(task))
+            self._restore(task, raw)
+
+    def _restore(self, task, raw: str) -> None:
+        task.output = TaskOutput(
+            name=task.name,
+            description=task.description,
+            expected_output=task.expected_output,
+            raw=raw,
+            agent=task.agent.role,
+        )
+        self.restored.add(id(task))
+        # task.callback is the _on_task_done partial; the stage's own callback (research merger) still runs
+        callback = task.callback.args[1]
+        if callback:
+            callback(task.output)
+        self._notify(task, raw)
+
+    def _classify_industry(self) -> None:
+        """
+        Classify a company seen for the first time, once it is clear its industry branch has to run,
+        then phrase that branch for the sector and reuse the sector's research when cached
+        """
+        task = next((t for t in self.pending_tasks if t.name == "research_industry"), None)
+        if not self._classify_pending or task is None:
+            return
+        self._classify_pending = False
+        self.industry = industry_knowledge.classify_industry(self.company, build_llm("research"))
+        if self.industry:
+            task.description = self.task_config.research_description("industry", self.company, self.industry)
+            self._reuse_industry_research(task)
+
+    def _on_task_done(self, task, callback, output):
+        if callback:
+            callback(output)
+        upstream = task.context if isinstance(task.context, list) else []
+        fingerprint = self.checkpoints.fingerprint(task, [dep.output.raw for dep in upstream])
+        self.checkpoints.save(task.name, fingerprint, output.raw)
+        if task.name == "research_industry" and self.industry:
+            industry_knowledge.save_research(self.industry, task, output.raw)
+        self._notify(task, output.raw)
+
+    def _compact_context(self, task, context: str) -> str:
+        """Replace the proposal's full upstream reports with a digest that fits the token budget"""
+        sections = {dep.name: dep.output.raw for dep in task.context if dep.output is not None}
+        digest, metrics = build_digest(sections, task.context_budget)
+        self.compaction_metrics = metrics
+
+        print(
+            f"🗜️ Context compaction: {metrics['tokens_before']} → {metrics['tokens_after']} tokens "
+            f"(budget {metrics['budget_tokens']})"
+        )
+        with open(f"outputs/{company_slug(self.company)}_compaction.json", "w", encoding="utf-8") as f:
+            json.dump(metrics, f, indent=2)
+        return digest
+
+    def _seed_context(self, task, context: str) -> str:
+        """Append the closest prior use case portfolios and research of other companies as reference material"""
+        with tracer.span("seed", task.name) as span:
+            neighbors = similarity_index.search(
+                context or self.company, k=self.seed_neighbors,
+                kinds=("usecases", "research"), exclude_company=self.company,
+            )
+            blocks, span["neighbors"] = [], []
+            for doc in neighbors:
+                try:
+                    with open(doc["path"], encoding="utf-8") as f:
+                        text = f.read()
+                except OSError:
+                    continue
+                name = doc["company"].replace("_", " ").title()
+                excerpt = compact_text(text, self.seed_budget // len(neighbors))
+                blocks.append(f"### {name} {doc['kind']} (similarity {doc['score']})\n{excerpt}")
+                span["neighbors"].append(doc["id"])
+        if not blocks:
+            return context
+
+        print(f"🌱 Warm start: seeding {task.name} with {', '.join(span['neighbors'])}")
+        seed = (
+            "## Prior analyses of similar companies\n"
+            f"Reference only: adapt ideas that fit {self.company}; re-verify every figure and source before reuse.\n\n"
+            + "\n\n".join(blocks)
+        )
+        return f"{context}\n\n{seed}" if context else seed
+
+    def _notify(self, task, raw: str):
+        """Report a finished stage so UIs can render it before the whole crew completes"""
+        if self.progress_callback:
+            self.progress_callback(task.name, raw)
+
     def create(self):
         """Initialize Crew with all agents and tasks"""
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        # replay mode serves every LLM call from recordings, so no key is needed
+        if not os.getenv("GEMINI_API_KEY") and llm_cache_mode() != "replay":
             raise ValueError("Missing GEMINI_API_KEY in environment variables")
 
+        self._classify_industry()
+        tasks = schedule_tasks(self.pending_tasks)
+        agents = list({id(t.agent): t.agent for t in tasks}.values())
+
         return Crew(
-            agents=[research_agent, usecase_agent, dataset_agent, proposal_agent],
-            tasks=[self.research_task, self.usecase_task, self.dataset_task, self.proposal_task],
+            agents=agents,
+            tasks=tasks,
             process=Process.sequential,
             verbose=True,
-            output_log_file=f"outputs/{self.company.lower().replace(' ','_')}_log.txt",
-            llm=LLM(
-                model="gemini/gemini-2.0-flash",
-                api_key=api_key,
-                temperature=0.35
-            )
+            output_log_file=f"outputs/{company_slug(self.company)}_log.txt",
+            llm=build_llm("crew")
         )
 
     def kickoff(self):
-        """Run the full workflow"""
-        return self.create().kickoff()
+        """Run the workflow, skipping stages restored from checkpoints"""
+        with tracer.run(self.run_id):
+            try:
+                with tracer.span("run", self.company, restored=len(self.restored)) as span:
+                    crew = self.create() if self.pending_tasks else None
+                    # industry classification in create() may have restored the shared industry branch
+                    span["shared"], span["industry"] = len(self.shared), self.industry
+                    if not self.pending_tasks:
+                        result = CrewOutput(
+                            raw=self.proposal_task.output.raw,
+                            tasks_output=[t.output for t in self.tasks],
+                        )
+                    else:
+                        result = crew.kickoff()
+                # later runs can warm-start from this company's reports
+                similarity_index.refresh(self.company)
+                return result
+            finally:
+                self._trace_summary = tracer.summarize(tracer.collect(self.run_id))
+                self._export_trace()
+                self.close()
+
+    def trace_summary(self):
+        """Per kind/name timing breakdown of this run's spans"""
+        if self._trace_summary is not None:
+            return self._trace_summary
+        return tracer.summarize(tracer.collect(self.run_id))
+
+    def close(self):
+        """Tear down per-run state; the shared LLM clients and tools stay warm for the next run"""
+        for agent in {id(t.agent): t.agent for t in self.tasks}.values():
+            # tool results accumulate on the agent across tasks
+            if isinstance(getattr(agent, "tools_results", None), list):
+                agent.tools_results.clear()
+        tracer.discard(self.run_id)
+
+    def _export_trace(self):
+        slug = company_slug(self.company)
+        tracer.export_jsonl(f"outputs/{slug}_trace.jsonl", self.run_id)
+        with open(f"outputs/{slug}_metrics.prom", "w", encoding="utf-8") as f:
+            f.write(tracer.prometheus_text(self.run_id))
 
 
-def create_ai_usecase_crew(company_name: str) -> AIUseCaseGenerationCrew:
+def create_ai_usecase_crew(company_name: str, **kwargs) -> AIUseCaseGenerationCrew:
     """Factory function to create AIUseCaseGenerationCrew instance"""
-    return AIUseCaseGenerationCrew(company_name)
+    return AIUseCaseGenerationCrew(company_name, **kwargs)
 
 
 def _detect_business_model(self, company: str) -> str:
@@ -0,0 +1,98 @@
+"""
+Industry Knowledge - Industry-level research shared by every company in the same sector
+
+Market size, growth and AI adoption trends do not depend on the company being
+analysed, so the industry research branch is cached per industry (with a TTL)
+and reused by the next company in that sector instead of being re-researched.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Optional
+
+from tools.http_cache import ResponseCache
+from utils import company_slug
+
+logger = logging.getLogger(__name__)
+
+# labels offered to the classifier; explicit industries may be any text
+INDUSTRIES = [
+    "Banking & Financial Services", "Insurance", "Retail & E-commerce", "Consumer Goods", "Healthcare",
+    "Pharmaceuticals & Life Sciences", "Manufacturing", "Automotive", "Energy & Utilities",
+    "Telecommunications", "Media & Entertainment", "Technology & Software", "Transportation & Logistics",
+    "Travel & Hospitality", "Real Estate & Construction", "Agriculture & Food", "Education", "Public Sector",
+]
+
+industry_cache = ResponseCache(
+    path=os.getenv("INDUSTRY_CACHE_PATH", os.path.join(".cache", "industry_cache.sqlite")),
+    max_bytes=50 * 1024 * 1024,
+    ttls={
+        "industry": int(os.getenv("INDUSTRY_TTL_DAYS", "30")) * 86400,
+        "company_industry": 365 * 86400,
+    },
+)
+industry_cache.enabled = os.getenv("INDUSTRY_CACHE", "1") != "0"
+
+
+def industry_key(industry: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", industry.lower()).strip("_")
+
+
+def normalize_industry(answer: str) -> Optional[str]:
+    """Map a free-text classifier answer onto one of INDUSTRIES"""
+    text = industry_key(answer or "")
+    for label in INDUSTRIES:
+        if industry_key(label) in text:
+            return label
+    for label in INDUSTRIES:
+        if industry_key(label.split(" & ")[0]) in text:
+            return label
+    return None
+
+
+def known_industry(company: str) -> Optional[str]:
+    """Industry a previous run classified the company into, without asking the LLM"""
+    return industry_cache.get("company_industry", company_slug(company))
+
+
+def classify_industry(company: str, llm) -> Optional[str]:
+    """Industry label for a company, asked once and remembered; None when the answer is unusable"""
+    cached = known_industry(company)
+    if cached:
+        return cached
+    prompt = (
+        f"Which industry does the company {company} primarily operate in? "
+        f"Answer with exactly one of: {'; '.join(INDUSTRIES)}."
+    )
+    try:
+        industry = normalize_industry(llm.call(prompt))
+    except Exception as e:
+        logger.warning("Industry classification for %s failed: %s", company, e)
+        return None
+    if industry:
+        industry_cache.set("company_industry", company_slug(company), industry)
+    return industry
+
+
+def research_key(industry: str, task) -> str:
+    """Entry key for a task's industry research; prompt or model changes start a fresh entry"""
+    parts = [
+        industry_key(industry),
+        task.description,
+        task.expected_output,
+        getattr(getattr(task.agent, "llm", None), "model", None),
+    ]
+    return hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+
+def load_research(industry: str, task) -> Optional[str]:
+    return industry_cache.get("industry", research_key(industry, task))
+
+
+def save_research(industry: str, task, raw: str) -> None:
+    # a branch that found nothing should not answer for the whole sector for a month
+    if raw and "No trusted info found" not in raw:
+        industry_cache.set("industry", research_key(industry, task), raw)
@@ -0,0 +1,222 @@
+"""
+Job Queue - Background analyses on a bounded local worker pool, tracked in SQLite
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from config.result_cache import RunAbandoned, proposal_cache
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class JobCancelled(RunAbandoned):
+    """
+    Raised at the next stage boundary of a job whose cancellation was requested.
+
+    Only this job ends as cancelled: jobs for the same company waiting on its run take it over.
+    """
+
+
+class JobQueue:
+    """
+    submit / status / result / cancel API for crew runs.
+
+    Jobs live in SQLite so results survive page reloads and restarts; workers claim
+    queued jobs atomically, so several app processes can share one store.
+    """
+
+    def __init__(self, path: str = None, max_workers: int = None, retention_days: int = 7):
+        self.path = path or os.getenv("JOB_DB_PATH", os.path.join(".cache", "jobs.sqlite"))
+        self.max_workers = max_workers or int(os.getenv("JOB_WORKERS", "2"))
+        self.retention_days = retention_days
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._executor = None
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def submit(self, company_name: str) -> str:
+        job_id = uuid.uuid4().hex[:12]
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, company, status, created) VALUES (?, ?, 'queued', ?)",
+                (job_id, " ".join(company_name.split()), time.time()),
+            )
+        self._pool().submit(self._execute, job_id)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, company, status, created, started, finished, error, cancel_requested, live_output, trace "
+                "FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            stages = conn.execute(
+                "SELECT stage, output FROM job_stages WHERE job_id = ? ORDER BY finished", (job_id,)
+            ).fetchall()
+        keys = ("id", "company", "status", "created", "started", "finished", "error", "cancel_requested", "live_output")
+        job = dict(zip(keys, row))
+        job["trace"] = json.loads(row[-1]) if row[-1] else []
+        job["stages"] = [{"stage": stage, "output": output} for stage, output in stages]
+        return job
+
+    def result(self, job_id: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT result FROM jobs WHERE id = ? AND status = 'completed'", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job now, or a running one at its next stage boundary"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id),
+            )
+            if cursor.rowcount:
+                return True
+            cursor = conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,)
+            )
+            return bool(cursor.rowcount)
+
+    def list_jobs(self, limit: int = 20) -> List[Dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, company, status, created FROM jobs ORDER BY created DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(zip(("id", "company", "status", "created"), row)) for row in rows]
+
+    def _execute(self, job_id: str) -> None:
+        with self._connect() as conn:
+            claimed = conn.execute(
+                "UPDATE jobs SET status = 'running', started = ?, owner = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), self.owner, job_id),
+            ).rowcount
+            row = conn.execute("SELECT company FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if not claimed:
+            return
+
+        try:
+            result = proposal_cache.get_or_run(row[0], lambda: self._run_crew(job_id, row[0]))
+            self._finish(job_id, "completed", result=result)
+        except JobCancelled:
+            self._finish(job_id, "cancelled")
+        except Exception as e:
+            self._finish(job_id, "failed", error=str(e))
+
+    def _run_crew(self, job_id: str, company_name: str) -> str:
+        from config.crew import create_ai_usecase_crew
+        from config.streaming import stream_task_tokens
+
+        def on_stage(stage: str, raw: str) -> None:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO job_stages (job_id, stage, output, finished) VALUES (?, ?, ?, ?)",
+                    (job_id, stage, raw, time.time()),
+                )
+                cancelled = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if cancelled and cancelled[0]:
+                raise JobCancelled(job_id)
+
+        tokens = []
+        last_flush = [0.0]
+
+        def on_token(chunk: str) -> None:
+            tokens.append(chunk)
+            # throttle writes; pollers only need a fresh-enough view
+            if time.time() - last_flush[0] > 0.5:
+                last_flush[0] = time.time()
+                with self._connect() as conn:
+                    conn.execute("UPDATE jobs SET live_output = ? WHERE id = ?", ("".join(tokens), job_id))
+
+        crew_system = create_ai_usecase_crew(company_name, progress_callback=on_stage)
+        with stream_task_tokens(crew_system.proposal_task, on_token):
+            result = crew_system.kickoff()
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET trace = ? WHERE id = ?", (json.dumps(crew_system.trace_summary()), job_id))
+        return result.output if hasattr(result, "output") else str(result)
+
+    def _finish(self, job_id: str, status: str, result: str = None, error: str = None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ? WHERE id = ?",
+                (status, result, error, time.time(), job_id),
+            )
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+                self._recover()
+            return self._executor
+
+    def _recover(self) -> None:
+        """Re-queue jobs whose worker process died, and pick up queued jobs nobody is running"""
+        with self._connect() as conn:
+            for job_id, owner in conn.execute("SELECT id, owner FROM jobs WHERE status = 'running'").fetchall():
+                if owner and not _process_alive(int(owner.split("-")[0])):
+                    conn.execute("UPDATE jobs SET status = 'queued' WHERE id = ? AND status = 'running'", (job_id,))
+            queued = [r[0] for r in conn.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY created")]
+            conn.execute(
+                "DELETE FROM jobs WHERE status IN ('completed', 'failed', 'cancelled') AND finished < ?",
+                (time.time() - self.retention_days * 86400,),
+            )
+            conn.execute("DELETE FROM job_stages WHERE job_id NOT IN (SELECT id FROM jobs)")
+        for job_id in queued:
+            self._executor.submit(self._execute, job_id)
+
+    @contextmanager
+    def _connect(self):
+        if not self._ready:
+            self._init_db()
+            # resume jobs orphaned by a restart as soon as anything opens the store, even a status poll
+            self._pool()
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, company TEXT, status TEXT, created REAL, started REAL, finished REAL, "
+                "owner TEXT, cancel_requested INTEGER DEFAULT 0, error TEXT, result TEXT, live_output TEXT, trace TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_stages ("
+                "job_id TEXT, stage TEXT, output TEXT, finished REAL, PRIMARY KEY (job_id, stage))"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._ready = True
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+job_queue = JobQueue()
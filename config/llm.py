@@ -0,0 +1,169 @@
+"""
+LLM Factory - Gemini clients per model tier, wrapped in an exact-match response cache with record/replay
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+from typing import Any, List, Optional
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from dotenv import load_dotenv
+
+from tools.http_cache import ResponseCache
+from tools.tracing import tracer
+from config.compaction import estimate_tokens
+from config.models import model_registry
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# off: always call the API | on: serve hits, record misses
+# record: always call the API and overwrite | replay: serve hits only, fail on a miss
+CACHE_MODES = ("off", "on", "record", "replay")
+
+llm_cache = ResponseCache(
+    path=os.getenv("LLM_CACHE_PATH", os.path.join(".cache", "llm_cache.sqlite")),
+    max_bytes=int(os.getenv("LLM_CACHE_MAX_MB", "500")) * 1024 * 1024,
+    ttls={"llm": int(os.getenv("LLM_CACHE_TTL_DAYS", "30")) * 86400},
+)
+
+
+_llm_factory = None
+
+
+def use_llm_factory(factory) -> None:
+    """Route build_llm through `factory(temperature=..., model=..., tier=..., **kwargs)`, e.g. a fake LLM for benchmarks"""
+    global _llm_factory
+    _llm_factory = factory
+
+
+class LLMReplayMiss(RuntimeError):
+    """Replay mode found no recorded response for a prompt."""
+
+
+def llm_cache_mode() -> str:
+    mode = os.getenv("LLM_CACHE", "on").lower()
+    return mode if mode in CACHE_MODES else "on"
+
+
+def _is_timeout(error: Exception) -> bool:
+    # litellm raises its own Timeout class; providers may surface plain TimeoutError
+    return isinstance(error, TimeoutError) or "timeout" in type(error).__name__.lower()
+
+
+class CachedLLM(BaseLLM):
+    """Delegates to a crewai LLM, keyed on model, messages and sampling parameters."""
+
+    def __init__(self, llm: LLM, tier: str = None, fallback: "CachedLLM" = None):
+        super().__init__(model=llm.model, temperature=llm.temperature)
+        self.llm = llm
+        self.tier = tier
+        self.fallback = fallback
+        self.stop = list(getattr(llm, "stop", None) or [])
+
+    def cache_key(self, messages: Any, tools: Optional[List[dict]] = None, stop: List[str] = None) -> str:
+        params = {
+            "model": self.llm.model,
+            "temperature": self.llm.temperature,
+            "max_tokens": getattr(self.llm, "max_tokens", None),
+            "top_p": getattr(self.llm, "top_p", None),
+            "stop": sorted(self.stop if stop is None else stop),
+            "tools": tools,
+            "messages": messages,
+        }
+        encoded = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, stop=None, **kwargs):
+        # agents of concurrent runs write stop words onto this shared wrapper; each call uses a snapshot
+        stop = list(self.stop if stop is None else stop)
+        prompt = messages if isinstance(messages, str) else "".join(str(m.get("content", "")) for m in messages)
+        with tracer.span(
+            "llm", self.llm.model, tier=self.tier, prompt_tokens=estimate_tokens(prompt), cache_hit=False
+        ) as span:
+            try:
+                response = self._call(messages, tools, callbacks, available_functions, span, stop, **kwargs)
+            except Exception as e:
+                if self.fallback is None or not _is_timeout(e):
+                    raise
+                logger.warning("⏱️ %s tier (%s) timed out, falling back to %s tier (%s)",
+                               self.tier, self.llm.model, self.fallback.tier, self.fallback.llm.model)
+                span["fallback"] = self.fallback.tier
+                response = self.fallback.call(
+                    messages, tools=tools, callbacks=callbacks, available_functions=available_functions,
+                    stop=stop, **kwargs
+                )
+            span["completion_tokens"] = estimate_tokens(response) if isinstance(response, str) else 0
+        logger.debug("%s tier (%s) answered in %.2fs", self.tier, self.llm.model, span["duration"])
+        return response
+
+    def _call(self, messages, tools, callbacks, available_functions, span, stop, **kwargs):
+        llm = self._with_stop(stop)
+        mode = llm_cache_mode()
+        if mode == "off":
+            return llm.call(
+                messages, tools=tools, callbacks=callbacks, available_functions=available_functions, **kwargs
+            )
+
+        key = self.cache_key(messages, tools, stop)
+        if mode != "record":
+            cached = llm_cache.get("llm", key)
+            if cached is not None:
+                span["cache_hit"] = True
+                return cached
+        if mode == "replay":
+            raise LLMReplayMiss(f"No recorded {self.llm.model} response for this prompt (LLM_CACHE=replay)")
+
+        response = llm.call(
+            messages, tools=tools, callbacks=callbacks, available_functions=available_functions, **kwargs
+        )
+        # tool-call responses are executed, not text; only plain completions are replayable
+        if isinstance(response, str):
+            llm_cache.set("llm", key, response)
+        return response
+
+    def _with_stop(self, stop: List[str]) -> LLM:
+        """The wrapped LLM sending `stop`; a shallow copy when they differ, so the shared client is never mutated"""
+        if list(getattr(self.llm, "stop", None) or []) == stop:
+            return self.llm
+        llm = copy.copy(self.llm)
+        llm.stop = stop
+        return llm
+
+    def supports_function_calling(self) -> bool:
+        return self.llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
+
+
+def build_llm(role: str, **kwargs) -> CachedLLM:
+    """Create the cached LLM for a role in config/models.json; every agent and the crew go through here"""
+    route = model_registry.route(role)
+    logger.info("🧭 %s → %s tier (%s, fallback: %s)", role, route.tier, route.model, route.fallback or "none")
+    if _llm_factory is not None:
+        return _llm_factory(temperature=route.temperature, model=route.model, tier=route.tier, **kwargs)
+
+    fallback = None
+    if route.fallback:
+        backup = model_registry.tier_route(route.fallback, route.temperature, role)
+        fallback = CachedLLM(_gemini(backup, **kwargs), tier=backup.tier)
+    return CachedLLM(_gemini(route, **kwargs), tier=route.tier, fallback=fallback)
+
+
+def _gemini(route, **kwargs) -> LLM:
+    return LLM(
+        model=route.model,
+        api_key=os.getenv("GEMINI_API_KEY"),
+        temperature=route.temperature,
+        timeout=route.timeout,
+        **kwargs,
+    )
@@ -0,0 +1,59 @@
+"""
+Model Registry - Which model tier each agent (and the crew) runs on
+
+Tiers and role assignments live in config/models.json (or the file named by
+MODEL_CONFIG). Environment variables override single entries without editing it:
+    MODEL_TIER_PROPOSAL=standard        # move a role to another tier
+    MODEL_FAST=gemini/gemini-2.0-flash  # point a tier at another model
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models.json")
+
+
+@dataclass(frozen=True)
+class Route:
+    role: str
+    tier: str
+    model: str
+    temperature: float
+    timeout: Optional[float]
+    fallback: Optional[str]
+
+
+class ModelRegistry:
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("MODEL_CONFIG", DEFAULT_CONFIG)
+        with open(self.path, encoding="utf-8") as f:
+            config = json.load(f)
+        self.tiers: Dict[str, Dict] = config["tiers"]
+        self.roles: Dict[str, Dict] = config["roles"]
+
+        for tier, spec in self.tiers.items():
+            spec["model"] = os.getenv(f"MODEL_{tier.upper()}", spec["model"])
+        for role, spec in self.roles.items():
+            spec["tier"] = os.getenv(f"MODEL_TIER_{role.upper()}", spec["tier"])
+            if spec["tier"] not in self.tiers:
+                raise ValueError(f"Role {role!r} uses unknown model tier {spec['tier']!r} ({self.path})")
+
+    def route(self, role: str) -> Route:
+        spec = self.roles[role]
+        return self.tier_route(spec["tier"], spec.get("temperature", 0.3), role)
+
+    def tier_route(self, tier: str, temperature: float, role: str = None) -> Route:
+        spec = self.tiers[tier]
+        return Route(
+            role=role or tier,
+            tier=tier,
+            model=spec["model"],
+            temperature=temperature,
+            timeout=spec.get("timeout"),
+            fallback=spec.get("fallback") if spec.get("fallback") in self.tiers else None,
+        )
+
+
+model_registry = ModelRegistry()
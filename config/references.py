@@ -0,0 +1,120 @@
+"""
+References - Deterministic, validated reference list built from the URLs every stage cited
+
+The proposal agent no longer re-types a References section: URLs are extracted from
+the stage outputs, canonicalized and deduplicated, checked concurrently with HEAD
+requests through the shared HTTP client, and rendered as markdown.
+"""
+
+import asyncio
+import os
+import re
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from tools.aio import run_sync
+from tools.http_client import http_client
+from tools.ranking import TRACKING_PARAMS, canonical_url
+
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]\n]{1,200})\]\((https?://[^)\s]+)\)")
+BARE_URL_RE = re.compile(r"https?://[^\s<>()\[\]{}\"'`|]+")
+GENERIC_TITLES = {"source", "link", "here", "url", "website", "read more", "view", "repo", "dataset"}
+
+# stage name prefix → heading, in the order the groups are rendered
+STAGE_GROUPS = [
+    ("research", "Market & Company Research"),
+    ("usecases", "Use Cases"),
+    ("resources", "Datasets, Models & Code"),
+    ("proposal", "Proposal"),
+]
+
+
+def clean_url(url: str) -> str:
+    """The URL as cited, minus tracking parameters (utm_*, fbclid, ...)"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k not in TRACKING_PARAMS and not k.startswith("utm_")]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def extract_references(sections: Dict[str, str]) -> List[Dict]:
+    """Unique URLs in first-seen order, keyed by canonical form, with the best link text found"""
+    references: Dict[str, Dict] = {}
+    for stage, text in sections.items():
+        links = [(title, url) for title, url in MARKDOWN_LINK_RE.findall(text or "")]
+        links += [(None, url) for url in BARE_URL_RE.findall(MARKDOWN_LINK_RE.sub(" ", text or ""))]
+        for title, url in links:
+            url = url.rstrip(".,;:!?*_'\"")
+            if not urlsplit(url).netloc:
+                continue
+            key, url = canonical_url(url), clean_url(url)
+            ref = references.setdefault(key, {"url": url, "title": None, "stage": stage, "status": None})
+            # render the cleanest spelling cited for this source: https first, then the shortest
+            if (not url.startswith("https:"), len(url)) < (not ref["url"].startswith("https:"), len(ref["url"])):
+                ref["url"] = url
+            title = (title or "").strip(" *_`")
+            if title and title.lower().strip(":") not in GENERIC_TITLES and not ref["title"]:
+                ref["title"] = title
+    return list(references.values())
+
+
+async def validate_references(references: List[Dict], concurrency: int = 16, deadline: float = 20) -> None:
+    """Set each reference's status code (0 = unreachable, None = not checked before the deadline)"""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def check(ref: Dict) -> None:
+        async with limit:
+            ref["status"] = await http_client.acheck_url(ref["url"], timeout=8)
+
+    tasks = [asyncio.ensure_future(check(ref)) for ref in references]
+    try:
+        if tasks:
+            await asyncio.wait(tasks, timeout=deadline)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def render_references(references: List[Dict]) -> str:
+    """Markdown References grouped by the stage that first cited each source; dead links are left out"""
+    broken = [r for r in references if r["status"] in (404, 410)]
+    kept = [r for r in references if r not in broken]
+    lines = ["## References", ""]
+    number = 0
+    known = tuple(prefix for prefix, _ in STAGE_GROUPS)
+    for prefix, heading in STAGE_GROUPS + [(None, "Other Sources")]:
+        group = [
+            r for r in kept
+            if (r["stage"].startswith(prefix) if prefix else not r["stage"].startswith(known))
+        ]
+        if not group:
+            continue
+        lines += [f"### {heading}", ""]
+        for ref in group:
+            number += 1
+            title = ref["title"] or (urlsplit(ref["url"]).netloc + urlsplit(ref["url"]).path).rstrip("/")
+            flag = "" if ref["status"] is None or 0 < ref["status"] < 400 else " ⚠️ unverified"
+            lines.append(f"{number}. [{title}]({ref['url']}){flag}")
+        lines.append("")
+    if not number:
+        lines += ["No sources were cited.", ""]
+    if broken:
+        lines.append(f"_{len(broken)} cited link(s) returned 404/410 and were omitted._")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def strip_references(text: str) -> str:
+    """Drop a References section the model wrote anyway, up to the next heading of the same or a higher level"""
+    return re.sub(
+        r"(?ims)^(#{1,3})\s*references\b.*?(?=^(?!\1#)#{1,6}\s(?!\s*references)|\Z)", "", text
+    ).rstrip()
+
+
+def build_references(sections: Dict[str, str], validate: Optional[bool] = None, limit: int = None) -> str:
+    """Extract, dedupe, optionally validate (LINK_CHECK=0 skips it) and render the References section"""
+    references = extract_references(sections)[: limit or int(os.getenv("REFERENCES_MAX", "100"))]
+    if validate is None:
+        validate = os.getenv("LINK_CHECK", "1") != "0"
+    if validate:
+        run_sync(validate_references(references))
+    return render_references(references)
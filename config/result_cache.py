@@ -0,0 +1,166 @@
+"""
+Proposal Cache - Persistent, cross-process result cache with single-flight runs
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+from tools.http_cache import ResponseCache
+
+# handed to waiters when the leading caller gave up, telling them to run it themselves
+_ABANDONED = object()
+
+
+class RunAbandoned(Exception):
+    """The leading caller stopped for its own reasons (e.g. its job was cancelled); waiters take over."""
+
+
+class ProposalCache:
+    """
+    Finished proposals keyed by normalized company name.
+
+    Identical concurrent requests collapse into one run: threads in the same
+    process share a Future, other processes wait on a lease row in SQLite until
+    the owner stores the result (or the lease expires and they take over).
+    """
+
+    provider = "proposal"
+
+    def __init__(self, path: str = None, ttl: int = None, max_mb: int = 50, lease_seconds: int = 1800,
+                 poll_interval: float = 2.0):
+        self.path = path or os.getenv("PROPOSAL_CACHE_PATH", os.path.join(".cache", "proposals.sqlite"))
+        ttl = ttl or int(os.getenv("PROPOSAL_CACHE_TTL_HOURS", "168")) * 3600
+        self.store = ResponseCache(path=self.path, max_bytes=max_mb * 1024 * 1024, ttls={self.provider: ttl})
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = uuid.uuid4().hex
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(company_name: str) -> str:
+        return " ".join(company_name.split()).casefold()
+
+    def get(self, company_name: str) -> Optional[str]:
+        return self.store.get(self.provider, self.normalize(company_name))
+
+    def set(self, company_name: str, proposal: str) -> None:
+        self.store.set(self.provider, self.normalize(company_name), proposal)
+
+    def get_or_run(self, company_name: str, run: Callable[[], str], on_wait: Callable[[], None] = None) -> str:
+        """Return the cached proposal, or run it once for all concurrent callers."""
+        key = self.normalize(company_name)
+        waited = False
+        while True:
+            cached = self.store.get(self.provider, key)
+            if cached is not None:
+                return cached
+
+            with self._lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = Future()
+                    self._inflight[key] = future
+
+            if not leader:
+                if on_wait and not waited:
+                    on_wait()
+                waited = True
+                result = future.result()
+                if result is _ABANDONED:
+                    # the leader gave up without failing; the next waiter in line becomes the leader
+                    continue
+                return result
+
+            try:
+                result = self._run_once(key, run, on_wait)
+            except RunAbandoned:
+                self._settle(key, future, result=_ABANDONED)
+                raise
+            except BaseException as e:
+                self._settle(key, future, error=e)
+                raise
+            self._settle(key, future, result=result)
+            return result
+
+    def _settle(self, key: str, future: Future, result=None, error: BaseException = None) -> None:
+        # leave the in-flight slot before waking waiters, so one of them can claim it
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _run_once(self, key: str, run: Callable[[], str], on_wait: Callable[[], None]) -> str:
+        waiting = False
+        while not self._acquire_lease(key):
+            if not waiting and on_wait:
+                on_wait()
+            waiting = True
+            time.sleep(self.poll_interval)
+            cached = self.store.get(self.provider, key)
+            if cached is not None:
+                return cached
+
+        try:
+            # another process may have finished between our cache miss and the lease
+            cached = self.store.get(self.provider, key)
+            if cached is not None:
+                return cached
+            result = run()
+            self.store.set(self.provider, key, result)
+            return result
+        finally:
+            self._release_lease(key)
+
+    def _acquire_lease(self, key: str) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT owner, expires FROM leases WHERE key = ?", (key,)).fetchone()
+            if row and row[0] != self.owner and row[1] > now:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (key, owner, expires) VALUES (?, ?, ?)",
+                (key, self.owner, now + self.lease_seconds),
+            )
+            return True
+
+    def _release_lease(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self.owner))
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT, expires REAL)")
+        return _Transaction(conn)
+
+
+class _Transaction:
+    """Autocommit connection wrapper that commits an explicit BEGIN on exit and always closes"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.conn.close()
+
+
+proposal_cache = ProposalCache()
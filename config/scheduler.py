@@ -0,0 +1,48 @@
+"""
+DAG Task Scheduler - Runs independent tasks concurrently within a sequential crew
+"""
+
+from typing import List
+from crewai import Task
+
+
+def _dependencies(task: Task) -> List[Task]:
+    return task.context if isinstance(task.context, list) else []
+
+
+def build_waves(tasks: List[Task]) -> List[List[Task]]:
+    """Group tasks into waves where every task only depends on earlier waves."""
+    known = {id(t) for t in tasks}
+    done = set()
+    remaining = list(tasks)
+    waves = []
+    while remaining:
+        wave = [
+            t for t in remaining
+            if all(id(dep) in done for dep in _dependencies(t) if id(dep) in known)
+        ]
+        if not wave:
+            raise ValueError("Task context dependencies contain a cycle")
+        waves.append(wave)
+        done.update(id(t) for t in wave)
+        remaining = [t for t in remaining if id(t) not in done]
+    return waves
+
+
+def schedule_tasks(tasks: List[Task]) -> List[Task]:
+    """
+    Topologically order tasks by `context` and mark parallel branches async.
+
+    A sequential crew runs consecutive async tasks concurrently and joins them at
+    the next sync task, so each multi-task wave is made async and the first task
+    of the following wave stays sync to act as the barrier.
+    """
+    waves = build_waves(tasks)
+    ordered = []
+    for i, wave in enumerate(waves):
+        last_wave = i == len(waves) - 1
+        for j, task in enumerate(wave):
+            joins_previous = j == 0 and ordered and ordered[-1].async_execution
+            task.async_execution = len(wave) > 1 and not last_wave and not joins_previous
+            ordered.append(task)
+    return ordered
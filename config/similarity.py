@@ -0,0 +1,175 @@
+"""
+Similarity Index - TF-IDF vectors over past research, use case and proposal reports
+
+Stored compactly as CSR term-frequency arrays (index.npz) plus a vocabulary and
+document list (meta.json); IDF weights and norms are derived at query time, so
+adding a document never rewrites the others.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from utils import company_slug
+
+KINDS = ("research", "usecases", "proposal")
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+\-]{2,}")
+URL_RE = re.compile(r"https?://\S+")
+STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "will", "can", "its", "their", "our",
+    "into", "than", "more", "has", "have", "not", "but", "all", "use", "case", "cases", "source", "company",
+}
+
+
+def tokenize(text: str) -> Counter:
+    return Counter(t for t in TOKEN_RE.findall(URL_RE.sub(" ", text.lower())) if t not in STOPWORDS)
+
+
+class SimilarityIndex:
+    def __init__(self, directory: str = None, outputs_dir: str = "outputs"):
+        self.directory = directory or os.getenv("SIMILARITY_INDEX_PATH", os.path.join(".cache", "similarity"))
+        self.outputs_dir = outputs_dir
+        self.vocab: Dict[str, int] = {}
+        self.docs: List[Dict] = []
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.data = np.zeros(0, dtype=np.float32)
+        self._pending: List[tuple] = []  # rows added since the arrays were last concatenated
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._refreshed = False
+
+    def add(self, doc_id: str, company: str, kind: str, text: str, path: str = None, mtime: float = None) -> None:
+        """Add or replace one document (sublinear term frequencies; IDF is applied at query time)"""
+        counts = tokenize(text)
+        with self._lock:
+            self._load()
+            self._remove(doc_id)
+            for term in counts:
+                self.vocab.setdefault(term, len(self.vocab))
+            ids = np.fromiter((self.vocab[t] for t in counts), dtype=np.int32, count=len(counts))
+            tf = np.fromiter((1.0 + math.log(c) for c in counts.values()), dtype=np.float32, count=len(counts))
+            self._pending.append((ids, tf))
+            self.docs.append({"id": doc_id, "company": company, "kind": kind, "path": path, "mtime": mtime})
+
+    def refresh(self, company: str = None) -> int:
+        """Index new or changed {slug}_{kind}.md reports in outputs/ (only `company`'s when given); returns count"""
+        if not os.path.isdir(self.outputs_dir):
+            return 0
+        slug = company_slug(company) if company else None
+        added = 0
+        with self._lock:
+            self._load()
+            known = {d["id"]: d.get("mtime") for d in self.docs}
+            for name in sorted(os.listdir(self.outputs_dir)):
+                match = re.fullmatch(rf"(.+)_({'|'.join(KINDS)})\.md", name)
+                if not match or (slug and match.group(1) != slug):
+                    continue
+                path = os.path.join(self.outputs_dir, name)
+                mtime = os.path.getmtime(path)
+                if known.get(name) == mtime:
+                    continue
+                with open(path, encoding="utf-8") as f:
+                    self.add(name, match.group(1), match.group(2), f.read(), path=path, mtime=mtime)
+                added += 1
+            if added:
+                self.save()
+        return added
+
+    def search(self, text: str, k: int = 3, kinds: Iterable[str] = KINDS, exclude_company: str = None,
+               min_score: float = 0.05) -> List[Dict]:
+        """Nearest documents by TF-IDF cosine similarity, best first"""
+        with self._lock:
+            if not self._refreshed:
+                self._refreshed = True
+                self.refresh()
+            self._load()
+            self._flush()
+            if not self.docs:
+                return []
+            n_docs, n_terms = len(self.docs), len(self.vocab)
+            df = np.bincount(self.indices, minlength=n_terms)
+            idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+            query = np.zeros(n_terms, dtype=np.float32)
+            for term, count in tokenize(text).items():
+                if term in self.vocab:
+                    query[self.vocab[term]] = (1.0 + math.log(count)) * idf[self.vocab[term]]
+            query_norm = float(np.linalg.norm(query))
+            if query_norm == 0:
+                return []
+
+            rows = np.repeat(np.arange(n_docs), np.diff(self.indptr))
+            weights = self.data * idf[self.indices]
+            dots = np.bincount(rows, weights=weights * query[self.indices], minlength=n_docs)
+            norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n_docs))
+            scores = dots / (norms * query_norm + 1e-12)
+
+            kinds = set(kinds)
+            excluded = company_slug(exclude_company) if exclude_company else None
+            results = []
+            for i in np.argsort(-scores):
+                doc = self.docs[i]
+                if scores[i] < min_score or len(results) >= k:
+                    break
+                if doc["kind"] in kinds and doc["company"] != excluded:
+                    results.append({**doc, "score": round(float(scores[i]), 3)})
+            return results
+
+    def save(self) -> None:
+        with self._lock:
+            self._flush()
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = os.path.join(self.directory, "index.tmp.npz")
+            np.savez_compressed(tmp, indptr=self.indptr, indices=self.indices, data=self.data)
+            os.replace(tmp, os.path.join(self.directory, "index.npz"))
+            vocab = sorted(self.vocab, key=self.vocab.get)
+            tmp = os.path.join(self.directory, "meta.json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"vocab": vocab, "docs": self.docs}, f)
+            os.replace(tmp, os.path.join(self.directory, "meta.json"))
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        lengths = np.fromiter((len(ids) for ids, _ in self._pending), dtype=np.int64, count=len(self._pending))
+        self.indices = np.concatenate([self.indices, *(ids for ids, _ in self._pending)])
+        self.data = np.concatenate([self.data, *(tf for _, tf in self._pending)])
+        self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(lengths)])
+        self._pending = []
+
+    def _remove(self, doc_id: str) -> None:
+        position = next((i for i, d in enumerate(self.docs) if d["id"] == doc_id), None)
+        if position is None:
+            return
+        self._flush()
+        start, end = self.indptr[position], self.indptr[position + 1]
+        self.indices = np.concatenate([self.indices[:start], self.indices[end:]])
+        self.data = np.concatenate([self.data[:start], self.data[end:]])
+        self.indptr = np.concatenate([self.indptr[:position + 1], self.indptr[position + 2:] - (end - start)])
+        self.docs.pop(position)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(os.path.join(self.directory, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            arrays = np.load(os.path.join(self.directory, "index.npz"))
+        except (OSError, ValueError):
+            return
+        if len(arrays["indptr"]) != len(meta["docs"]) + 1:
+            return  # torn write from another process; refresh() rebuilds from outputs/
+        self.vocab = {term: i for i, term in enumerate(meta["vocab"])}
+        self.docs = meta["docs"]
+        self.indptr, self.indices, self.data = arrays["indptr"], arrays["indices"], arrays["data"]
+
+
+similarity_index = SimilarityIndex()
@@ -0,0 +1,63 @@
+"""
+Token Streaming - Routes LLM stream chunks from the crewai event bus to per-run sinks
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+try:
+    from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+except ImportError:
+    try:
+        from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+    except ImportError:  # crewai without streaming events
+        crewai_event_bus = LLMStreamChunkEvent = None
+
+_sinks: Dict[object, Callable[[str], None]] = {}
+_lock = threading.Lock()
+_handler_registered = False
+
+
+def _register_handler() -> None:
+    global _handler_registered
+    with _lock:
+        if _handler_registered:
+            return
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def _route_chunk(source, event):
+            # newer crewai tags events with the task; older versions emit on the calling thread
+            task_id = getattr(event, "task_id", None)
+            sink = _sinks.get(str(task_id)) if task_id else None
+            if sink is None:
+                sink = _sinks.get(threading.get_ident())
+            if sink is not None:
+                sink(event.chunk)
+
+        _handler_registered = True
+
+
+@contextmanager
+def stream_task_tokens(task, sink: Callable[[str], None]):
+    """
+    Forward stream chunks produced for `task` to `sink` while the block runs.
+
+    Enter it on the thread that calls kickoff(). Only LLMs built with
+    stream=True emit chunks; yields False when crewai has no streaming events.
+    """
+    if crewai_event_bus is None:
+        yield False
+        return
+
+    _register_handler()
+    keys = [str(task.id), threading.get_ident()]
+    with _lock:
+        for key in keys:
+            _sinks[key] = sink
+    try:
+        yield True
+    finally:
+        with _lock:
+            for key in keys:
+                _sinks.pop(key, None)
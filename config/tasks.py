@@ -3,7 +3,119 @@ Optimized Task Configuration
 """
 
 import os
+import threading
+from functools import partial
+from typing import Any, Optional
 from crewai import Task
+from config.usecases import PORTFOLIO_INSTRUCTIONS, save_portfolio
+from tools.tracing import tracer
+from utils import company_slug
+
+# Independent research branches: (key, section title, description, expected output)
+RESEARCH_BRANCHES = [
+    (
+        "business_model",
+        "Business Model",
+        "Identify if {company} is a B2B or B2C company and how it makes money:\n"
+        "- Revenue streams, customer segments and sales channels\n"
+        "Include [Source: URL] for all major claims",
+        "B2B/B2C classification with supporting evidence (or state 'No trusted info found')",
+    ),
+    (
+        "industry",
+        "Industry Analysis",
+        "Analyze the industry {company} operates in:\n"
+        "- Market size ($B), CAGR, AI adoption maturity (1-5 scale)\n"
+        "- Key AI transformation trends with quantified impact\n"
+        "Include [Source: URL] for all major claims",
+        "Market analysis (size, CAGR, trends) with sources if available",
+    ),
+    (
+        "company",
+        "Company Analysis",
+        "Profile {company}:\n"
+        "- Revenue, employees, market position\n"
+        "- Current tech stack, AI readiness score, strategic priorities and pain points\n"
+        "Include [Source: URL] for all major claims",
+        "Company profile with AI readiness score",
+    ),
+    (
+        "competitors",
+        "Competitive Landscape",
+        "Analyze the top 3-5 competitors in {company}'s market:\n"
+        "- Their AI strategies and initiatives\n"
+        "- Market positioning and differentiation gaps for {company}\n"
+        "Include [Source: URL] for all major claims",
+        "Competitor AI initiatives and positioning gaps",
+    ),
+]
+
+
+# Industry branch wording when the industry is known: company-agnostic, so one answer serves the sector
+SHARED_INDUSTRY_BRANCH = (
+    "Analyze the {industry} industry as a whole (not any single company):\n"
+    "- Market size ($B), CAGR, AI adoption maturity (1-5 scale)\n"
+    "- Key AI transformation trends with quantified impact\n"
+    "Include [Source: URL] for all major claims"
+)
+
+
+class ResearchMerger:
+    """Collects research branch outputs and writes them as one report once all have finished."""
+
+    def __init__(self, company_name: str, output_file: str):
+        self.company_name = company_name
+        self.output_file = output_file
+        self.sections = {}
+        self._lock = threading.Lock()
+
+    def collect(self, key: str, output) -> None:
+        with self._lock:
+            self.sections[key] = output.raw if hasattr(output, "raw") else str(output)
+            if len(self.sections) == len(RESEARCH_BRANCHES):
+                self.write()
+
+    def write(self) -> None:
+        report = f"# {self.company_name} Research Report\n\n"
+        for key, title, _, _ in RESEARCH_BRANCHES:
+            report += f"## {title}\n\n{self.sections.get(key, 'No trusted info found')}\n\n"
+        with open(self.output_file, "w", encoding="utf-8", newline="\n") as f:
+            f.write(report)
+
+
+class PipelineTask(Task):
+    """
+    Task that records a "task" span, attributing its LLM and tool calls to the crew run.
+
+    An optional `context_seeder(task, context)` may extend the upstream context with
+    reference material (e.g. prior analyses) right before the agent is prompted.
+    """
+
+    run_id: Optional[str] = None
+    context_seeder: Optional[Any] = None
+
+    def _execute_core(self, agent, context, tools):
+        # sync and async execution both end up here, on the thread that does the work
+        with tracer.bind(self.run_id):
+            if self.context_seeder:
+                context = self.context_seeder(self, context)
+            with tracer.span("task", self.name, context_chars=len(context or "")) as span:
+                output = super()._execute_core(agent, context, tools)
+                span["output_chars"] = len(output.raw or "")
+                return output
+
+
+class CompactedContextTask(PipelineTask):
+    """Task whose upstream context is passed through `context_compactor(task, context)` before prompting"""
+
+    context_compactor: Optional[Any] = None
+    context_budget: Optional[int] = None
+
+    def execute_sync(self, agent=None, context=None, tools=None):
+        if self.context_compactor and context:
+            context = self.context_compactor(self, context)
+        return super().execute_sync(agent=agent, context=context, tools=tools)
+
 
 class TaskConfig:
     @staticmethod
@@ -13,7 +125,8 @@ class TaskConfig:
     @staticmethod
     def create_research_task(research_agent, company_name: str):
         TaskConfig._ensure_output_dir()
-        return Task(
+        return PipelineTask(
+            name="research",
             description=(
                 f"Conduct executive-level research for {company_name}:\n"
                 f"1. BUSINESS MODEL: Identify if {company_name} is B2B or B2C company\n"
@@ -32,13 +145,54 @@ class TaskConfig:
                 "⚠️ If any section lacks info from trusted sources, explicitly note it."
             ),
             agent=research_agent,
-            output_file=f"outputs/{company_name.lower().replace(' ', '_')}_research.md",
+            output_file=f"outputs/{company_slug(company_name)}_research.md",
+        )
+
+    @staticmethod
+    def research_description(key: str, company_name: str, industry: str = None) -> str:
+        """Prompt for one research branch; with `industry` set the industry branch covers the sector"""
+        _, title, description, _ = next(branch for branch in RESEARCH_BRANCHES if branch[0] == key)
+        subject = company_name
+        if key == "industry" and industry:
+            subject, description = f"the {industry} industry", SHARED_INDUSTRY_BRANCH
+        return (
+            f"{title.upper()} research for {subject}:\n"
+            + description.format(company=company_name, industry=industry)
+            + "\nQuantify everything - market size, growth rates, adoption metrics"
+        )
+
+    @staticmethod
+    def create_research_subtasks(research_agent, company_name: str, industry: str = None):
+        """
+        One task per research branch; branches run concurrently and merge into _research.md.
+        With `industry` set, the industry branch is phrased for the sector so it can be shared.
+        """
+        TaskConfig._ensure_output_dir()
+        merger = ResearchMerger(
+            company_name, f"outputs/{company_slug(company_name)}_research.md"
         )
+        tasks = []
+        for key, _, _, expected_output in RESEARCH_BRANCHES:
+            tasks.append(
+                PipelineTask(
+                    name=f"research_{key}",
+                    description=TaskConfig.research_description(key, company_name, industry),
+                    expected_output=(
+                        expected_output
+                        + "\n⚠️ If this section lacks info from trusted sources, explicitly note it."
+                    ),
+                    # each branch gets its own agent copy so concurrent executors don't share state
+                    agent=research_agent.copy(),
+                    callback=partial(merger.collect, key),
+                )
+            )
+        return tasks
 
     @staticmethod
     def create_usecase_task(usecase_agent, company_name: str):
         TaskConfig._ensure_output_dir()
-        return Task(
+        return PipelineTask(
+            name="usecases",
             description=(
                 f"Generate 10-12 strategic AI use cases for {company_name}:\n"
                 f"1. Use business model (B2B/B2C) from research to tailor use cases\n"
@@ -47,6 +201,7 @@ class TaskConfig:
                 f"   - Estimated ROI (% or $ savings), Complexity, Industry Example\n"
                 f"3. Categorize into: Quick Wins, Strategic Initiatives, Transformational\n"
                 f"4. Cover: Predictive Analytics, NLP/GenAI, Computer Vision, Automation\n"
+                f"5. {PORTFOLIO_INSTRUCTIONS}\n"
                 f"Make each use case a mini-business case for {company_name}"
             ),
             expected_output=(
@@ -55,20 +210,24 @@ class TaskConfig:
                 f"- Clear prioritization: Quick Wins/Strategic/Transformational\n"
                 f"- Quantified ROI estimates for each use case\n"
                 f"- Industry examples and implementation complexity\n"
-                f"- Tailored to {company_name}'s business model and industry"
+                f"- Tailored to {company_name}'s business model and industry\n"
+                f"- A closing ```json block listing every use case (name, category, domain_keywords, roi, complexity)"
             ),
             agent=usecase_agent,
-            output_file=f"outputs/{company_name.lower().replace(' ', '_')}_usecases.md",
+            output_file=f"outputs/{company_slug(company_name)}_usecases.md",
+            # the validated portfolio drives the dataset stage and is saved as _usecases.json
+            callback=partial(save_portfolio, f"outputs/{company_slug(company_name)}_usecases.json"),
         )
 
     @staticmethod
     def create_dataset_task(dataset_agent, company_name: str):
         TaskConfig._ensure_output_dir()
-        return Task(
+        return PipelineTask(
+            name="resources",
             description=(
                 f"Find datasets and resources for {company_name} AI use cases:\n"
                 f"1. Map specific datasets to each use case identified\n"
-                f"2. Search Kaggle, HuggingFace, GitHub for relevant resources\n"
+                f"2. Search Kaggle, HuggingFace, GitHub for relevant resources (all use cases in one batch search)\n"
                 f"3. For each resource provide: [Title](URL), quality score, description\n"
                 f"4. Include pre-trained models, APIs, and code repositories\n"
                 f"5. Organize by use case priority (Quick Wins first)\n"
@@ -83,13 +242,14 @@ class TaskConfig:
                 f"- Organized by use case priority tier"
             ),
             agent=dataset_agent,
-            output_file=f"outputs/{company_name.lower().replace(' ', '_')}_resources.md",
+            output_file=f"outputs/{company_slug(company_name)}_resources.md",
         )
 
     @staticmethod
     def create_proposal_task(proposal_agent, company_name: str):
         TaskConfig._ensure_output_dir()
-        return Task(
+        return CompactedContextTask(
+            name="proposal",
             description=(
                 f"Create executive AI Transformation Proposal for {company_name}:\n"
                 f"Synthesize all research, use cases, and resources into professional report:\n"
@@ -98,7 +258,7 @@ class TaskConfig:
                 f"3. AI Use Case Portfolio (prioritized with ROI)\n"
                 f"4. Dataset & Resource Assets (organized by use case)\n"
                 f"5. Implementation Roadmap (specific phases with named use cases)\n"
-                f"6. References (all sources with clickable links)\n"
+                f"Cite sources inline; the References section is appended automatically, do not write one\n"
                 f"Quality must match top-tier strategy consultant standards"
             ),
             expected_output=(
@@ -108,9 +268,8 @@ class TaskConfig:
                 f"- 10-12 prioritized use cases with business cases\n"
                 f"- Resource recommendations mapped to use cases\n"
                 f"- Phased implementation roadmap with specific use case timelines\n"
-                f"- Complete reference list with sources\n"
                 f"- Executive presentation quality with proper formatting"
             ),
             agent=proposal_agent,
-            output_file=f"outputs/{company_name.lower().replace(' ', '_')}_proposal.md",
+            output_file=f"outputs/{company_slug(company_name)}_proposal.md",
         )
\ No newline at end of file
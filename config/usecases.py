@@ -0,0 +1,102 @@
+"""
+Use Case Schema - Validated use case portfolio emitted as a JSON block after the markdown
+
+The use case agent appends the block to its report; downstream stages read it
+instead of having an LLM re-parse the prose (e.g. the dataset stage fans one
+search out per use case without any LLM turns).
+"""
+
+import json
+import re
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+CATEGORIES = ("Quick Win", "Strategic Initiative", "Transformational")
+
+# appended to the use case task; the marker phrase lets stand-in LLMs recognise the request
+PORTFOLIO_INSTRUCTIONS = (
+    "After the markdown, end with a fenced ```json use-case JSON block of the form "
+    '{"use_cases": [{"name": "...", "category": "Quick Win|Strategic Initiative|Transformational", '
+    '"domain_keywords": ["2-5 dataset search keywords"], "roi": "...", "complexity": "Low|Medium|High"}]} '
+    "with one entry per use case"
+)
+
+JSON_BLOCK_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+class UseCase(BaseModel):
+    name: str = Field(..., min_length=3)
+    category: Literal["Quick Win", "Strategic Initiative", "Transformational"]
+    domain_keywords: List[str] = Field(..., min_length=1)
+    roi: str = ""
+    complexity: Literal["Low", "Medium", "High"] = "Medium"
+
+    @field_validator("category", mode="before")
+    @classmethod
+    def _category(cls, value):
+        lowered = str(value).strip().lower()
+        for category in CATEGORIES:
+            if lowered.startswith(category.lower()[:5]):
+                return category
+        return value
+
+    @field_validator("roi", mode="before")
+    @classmethod
+    def _roi(cls, value):
+        # models often answer with a bare number (25 for "25%")
+        return "" if value is None else str(value).strip()
+
+    @field_validator("complexity", mode="before")
+    @classmethod
+    def _complexity(cls, value):
+        match = re.search(r"low|medium|high", str(value).lower())
+        return match.group(0).capitalize() if match else "Medium"
+
+    @field_validator("domain_keywords", mode="before")
+    @classmethod
+    def _keywords(cls, value):
+        if isinstance(value, str):
+            value = value.split(",")
+        if not isinstance(value, list):
+            return value
+        return [str(k).strip() for k in value if str(k).strip()][:6]
+
+    @property
+    def search_query(self) -> str:
+        return " ".join(self.domain_keywords[:4])
+
+
+class UseCasePortfolio(BaseModel):
+    use_cases: List[UseCase] = Field(..., min_length=1)
+
+    def by_priority(self) -> List[UseCase]:
+        return sorted(self.use_cases, key=lambda u: CATEGORIES.index(u.category))
+
+
+def extract_portfolio(text: str) -> Optional[UseCasePortfolio]:
+    """The last valid use case block in `text`; entries that fail validation are dropped"""
+    for block in reversed(JSON_BLOCK_RE.findall(text or "")):
+        try:
+            items = json.loads(block).get("use_cases", [])
+        except (ValueError, AttributeError):
+            continue
+        valid = []
+        for item in items if isinstance(items, list) else []:
+            try:
+                valid.append(UseCase.model_validate(item))
+            except ValidationError:
+                continue
+        if valid:
+            return UseCasePortfolio(use_cases=valid)
+    return None
+
+
+def save_portfolio(path: str, output) -> None:
+    """Task callback: attach the validated portfolio to the output and write it next to the markdown"""
+    portfolio = extract_portfolio(output.raw)
+    if portfolio is None:
+        return
+    output.pydantic = portfolio
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(portfolio.model_dump_json(indent=2))
@@ -2,8 +2,10 @@
 Streamlit Web Application for AI Use Case Generation System
 """
 
+import time
+
 import streamlit as st
-from config.crew import create_ai_usecase_crew
+from config.jobs import TERMINAL_STATUSES, job_queue
 
 st.set_page_config(
     page_title="AI Use Case Generator",
@@ -11,45 +13,121 @@ st.set_page_config(
     layout="centered",
 )
 
-@st.cache_data
-def run_crew_analysis(company_name: str) -> str:
-    """Runs the CrewAI pipeline and returns ONLY the final proposal text (no file saving)."""
-    crew_system = create_ai_usecase_crew(company_name)
+STAGE_TITLES = {
+    "research": "🔍 Research",
+    "research_business_model": "🏢 Business Model",
+    "research_industry": "📈 Industry Analysis",
+    "research_company": "🔍 Company Analysis",
+    "research_competitors": "🥊 Competitive Landscape",
+    "usecases": "💡 AI Use Cases",
+    "resources": "📚 Datasets & Resources",
+}
+
+POLL_SECONDS = 1.0
+
+
+def render_job(job_id: str) -> None:
+    """Show a queued/running job's progress, polling until it finishes; the result survives reloads."""
+    job = job_queue.status(job_id)
+    if job is None:
+        st.warning("⚠️ Unknown analysis job, it may have expired.")
+        st.query_params.clear()
+        return
+
+    if job["status"] == "completed":
+        st.success(f"✅ Analysis of {job['company']} completed!")
+    elif job["status"] == "failed":
+        st.error(f"❌ Error occurred: {job['error']}")
+    elif job["status"] == "cancelled":
+        st.warning("🛑 Analysis cancelled.")
+    elif job["status"] == "queued":
+        st.info(f"⏳ {job['company']} is queued, waiting for a free worker...")
+    else:
+        label = "🛑 Cancelling after the current stage..." if job["cancel_requested"] else (
+            f"🔍 Analyzing {job['company']} and generating AI use cases..."
+        )
+        st.info(label)
+
+    for stage in job["stages"]:
+        if stage["stage"] in STAGE_TITLES:
+            with st.expander(f"✅ {STAGE_TITLES[stage['stage']]}"):
+                st.markdown(stage["output"])
+
+    if job["status"] == "completed":
+        final_result = job_queue.result(job_id)
+        st.subheader("📑 Final Proposal")
+        st.markdown(final_result)
+        render_timing_breakdown(job["trace"])
+        st.download_button(
+            label="💾 Download Full Report",
+            data=final_result,
+            file_name=f"{job['company'].lower().replace(' ', '_')}_final_proposal.md",
+            mime="text/markdown",
+        )
+        return
+    if job["status"] in TERMINAL_STATUSES:
+        return
+
+    if job["live_output"]:
+        st.subheader("📑 Final Proposal")
+        st.markdown(job["live_output"])
+    if not job["cancel_requested"] and st.button("Cancel Analysis"):
+        job_queue.cancel(job_id)
+    time.sleep(POLL_SECONDS)
+    st.rerun()
+
+
+def render_timing_breakdown(summary: list) -> None:
+    """Collapsible per-task / LLM / tool / HTTP timing table for the finished run"""
+    if not summary:
+        return
+    with st.expander("⏱️ Timing breakdown"):
+        st.dataframe(
+            [
+                {
+                    "kind": g["kind"],
+                    "name": f"{g['name']} ({g['tier']})" if g.get("tier") else g["name"],
+                    "calls": g["count"],
+                    "total (s)": g["total_s"],
+                    "max (s)": g["max_s"],
+                    "errors": g["errors"],
+                    "cache hits": g["cache_hits"],
+                    "tokens in/out": f"{g['prompt_tokens']}/{g['completion_tokens']}",
+                }
+                for g in summary
+            ],
+            use_container_width=True,
+        )
+        st.caption("Full spans: outputs/{company}_trace.jsonl · Prometheus: outputs/{company}_metrics.prom")
 
-    result = crew_system.kickoff()
-    
-    final_proposal = result.output if hasattr(result, "output") else str(result)
-    return final_proposal
 
 def main():
     """Main Streamlit application"""
-    
+
     st.title("🤖 AI Use Case Generator")
     st.write("Enter a company name to generate AI use cases and strategies.")
-    
+
     company_name = st.text_input("Company Name", placeholder="e.g., Tesla")
 
     if st.button("Analyze Company"):
         if not company_name.strip():
             st.error("⚠️ Please enter a company name.")
         else:
-            with st.spinner("🔍 Analyzing company and generating AI use cases..."):
-                try:
-                    final_result = run_crew_analysis(company_name.strip())
-                    
-                    st.success("✅ Analysis completed!")
-
-                    st.subheader("📑 Final Proposal")
-                    st.markdown(final_result)
-
-                    st.download_button(
-                        label="💾 Download Full Report",
-                        data=final_result,
-                        file_name=f"{company_name.lower().replace(' ', '_')}_final_proposal.md",
-                        mime="text/markdown",
-                    )
-                except Exception as e:
-                    st.error(f"❌ Error occurred: {str(e)}")
+            # runs on the background worker pool; the job id in the URL lets a reload pick it back up
+            st.query_params["job"] = job_queue.submit(company_name.strip())
+            st.rerun()
+
+    with st.sidebar:
+        st.subheader("🗂️ Recent Analyses")
+        for job in job_queue.list_jobs(limit=10):
+            if st.button(f"{job['company']} · {job['status']}", key=f"job-{job['id']}"):
+                st.query_params["job"] = job["id"]
+                st.rerun()
+
+    job_id = st.query_params.get("job")
+    if job_id:
+        render_job(job_id)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,23 +2,22 @@
 Launch script for the Streamlit application
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def check_requirements():
-    """Check if all required packages are installed"""
-    try:
-        import streamlit
-        import crewai
-        import dotenv
-        print("✅ All required packages are available")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
+    """Check if all required packages are installed (without importing them)"""
+    missing = [pkg for pkg in ("streamlit", "crewai", "dotenv") if importlib.util.find_spec(pkg) is None]
+    if missing:
+        print(f"❌ Missing required package: {', '.join(missing)}")
         print("Please install requirements: pip install -r requirements.txt")
         return False
 
+    print("✅ All required packages are available")
+    return True
+
 def check_env_vars():
     """Check if environment variables are set"""
     from dotenv import load_dotenv
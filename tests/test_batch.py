@@ -0,0 +1,16 @@
+from batch import load_companies
+
+
+def test_load_companies_csv_name_header(tmp_path):
+    path = tmp_path / "companies.csv"
+    path.write_text("name,industry\nAcme Retail,Retail\nGlobex,Insurance\n", encoding="utf-8")
+    assert load_companies(str(path)) == ["Acme Retail", "Globex"]
+
+
+def test_load_companies_csv_company_column_and_headerless(tmp_path):
+    with_header = tmp_path / "with_header.csv"
+    with_header.write_text("industry,company\nRetail,Acme Retail\n", encoding="utf-8")
+    headerless = tmp_path / "headerless.csv"
+    headerless.write_text("Acme Retail\nGlobex\n", encoding="utf-8")
+    assert load_companies(str(with_header)) == ["Acme Retail"]
+    assert load_companies(str(headerless)) == ["Acme Retail", "Globex"]
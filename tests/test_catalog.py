@@ -0,0 +1,26 @@
+from tools.catalog import Catalog
+
+
+def _catalog(tmp_path):
+    catalog = Catalog(path=str(tmp_path / "catalog.sqlite"), enabled=True, min_hits=3)
+    catalog.upsert("github", [{
+        "name": "pcb-defect-detection",
+        "full_name": "example/pcb-defect-detection",
+        "html_url": "https://github.com/example/pcb-defect-detection",
+        "description": "PCB defect detection with YOLO",
+        "stargazers_count": 120,
+    }])
+    return catalog
+
+
+def test_search_ignores_entries_matching_only_part_of_the_query(tmp_path):
+    catalog = _catalog(tmp_path)
+    assert catalog.search("github", "fraud detection", partial=True) == []
+
+
+def test_too_few_matches_are_a_partial_hit(tmp_path):
+    catalog = _catalog(tmp_path)
+    assert catalog.search("github", "pcb defect detection") == []
+    partial = catalog.search("github", "pcb defect detection", partial=True)
+    assert [r["ref"] for r in partial] == ["example/pcb-defect-detection"]
+    assert not catalog.is_hit(partial)
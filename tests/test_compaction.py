@@ -0,0 +1,19 @@
+from config.compaction import compact_text, estimate_tokens
+
+
+def test_compact_text_fits_budget_when_every_line_is_a_fact():
+    lines = ["# Use Cases"]
+    for i in range(600):
+        lines.append(f"- **ROI:** {30 + i % 50}% within 12 months, see https://example.com/report/{i}")
+    text = "\n".join(lines)
+    compacted = compact_text(text, 2000)
+    assert estimate_tokens(compacted) <= 2000 < estimate_tokens(text)
+    assert compacted.startswith("# Use Cases")
+
+
+def test_compact_text_keeps_headings_and_drops_weakest_lines_first():
+    text = "## Summary\n**ROI:** 40% https://example.com/a\nplain prose line with no facts 1\nrevenue grew 5%"
+    compacted = compact_text(text, 20)
+    assert "## Summary" in compacted
+    assert "**ROI:** 40%" in compacted
+    assert "revenue grew" not in compacted
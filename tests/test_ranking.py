@@ -0,0 +1,9 @@
+import math
+
+from tools.ranking import _parse_size
+
+
+def test_parse_size_reads_units_and_ignores_a_bare_dot():
+    assert _parse_size("1.5 KB") == 1.5 * _parse_size("1 KB")
+    assert _parse_size(".5 MB") == _parse_size("0.5 MB")
+    assert math.isnan(_parse_size(". GB"))
@@ -0,0 +1,25 @@
+from config.references import extract_references, strip_references
+
+
+def test_strip_references_keeps_following_sibling_sections():
+    text = "### References\n- [a](https://a.example.com)\n### Phase 3\nkeep me\n## Appendix"
+    assert strip_references(text) == "### Phase 3\nkeep me\n## Appendix"
+
+
+def test_strip_references_removes_nested_subsections():
+    text = "# Plan\n## References\n- x\n### Web\n- y\n## Appendix\nz"
+    assert strip_references(text) == "# Plan\n## Appendix\nz"
+
+
+def test_strip_references_at_end_of_document():
+    assert strip_references("## Summary\nok\n\n## References\n- x\n") == "## Summary\nok"
+
+
+def test_extract_references_renders_the_url_without_tracking_parameters():
+    sections = {
+        "research": "See [Market report](http://example.com/report?utm_source=x&id=7).",
+        "proposal": "Also https://example.com/report?id=7&fbclid=abc#top",
+    }
+    (ref,) = extract_references(sections)
+    assert ref["url"] == "https://example.com/report?id=7#top"
+    assert ref["title"] == "Market report"
@@ -0,0 +1,65 @@
+"""
+Async Helpers - Run tool coroutines from synchronous code on one shared event loop
+
+Sync callers (crewai's blocking tool path, scripts) hand their coroutine to a single
+background loop instead of starting a loop or a thread per call, so every tool shares
+the same pooled async HTTP connections.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, List, TypeVar
+
+T = TypeVar("T")
+
+_loop = None
+_thread = None
+_lock = threading.Lock()
+# awaited on a temporary loop before it closes, so loop-bound resources (connection pools) go with it
+_loop_cleanups: List[Callable[[], Awaitable[None]]] = []
+
+
+def on_loop_exit(cleanup: Callable[[], Awaitable[None]]) -> None:
+    """Register a coroutine function to run at the end of every temporary loop run_sync starts"""
+    _loop_cleanups.append(cleanup)
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="tools-aio", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Block the calling thread until coro finishes on the shared background loop"""
+    loop = _background_loop()
+    if threading.current_thread() is _thread:
+        # a coroutine on the shared loop called blocking code; waiting on the loop here would deadlock
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.setdefault("value", asyncio.run(_capture(coro, cleanup=True)))
+        )
+        worker.start()
+        worker.join()
+        value, error = result["value"]
+        if error is not None:
+            raise error
+        return value
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def _capture(coro, cleanup: bool = False):
+    try:
+        return await coro, None
+    except BaseException as e:
+        return None, e
+    finally:
+        for close in _loop_cleanups if cleanup else []:
+            try:
+                await close()
+            except Exception:
+                pass
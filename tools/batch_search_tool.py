@@ -0,0 +1,116 @@
+"""
+Batch Resource Search Tool - Kaggle + GitHub searches for many use cases in one call
+"""
+
+import asyncio
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+from typing import ClassVar, Dict, List, Type
+from tools.aio import run_sync
+from tools.github_code_tool import github_code_tool
+from tools.kaggle_tool import kaggle_dataset_tool
+from tools.tracing import traced_tool
+
+
+class BatchSearchInput(BaseModel):
+    queries: List[str] = Field(..., description="One short search query per use case, e.g. ['demand forecasting retail', 'customer churn telecom']")
+
+
+class BatchResourceSearchTool(BaseTool):
+    name: str = "Batch Resource Search"
+    description: str = (
+        "Search Kaggle datasets and GitHub repositories for a LIST of queries at once "
+        "(one query per use case). Returns results grouped by query."
+    )
+    args_schema: Type[BaseModel] = BatchSearchInput
+
+    # every (query, platform) search runs concurrently; stragglers are reported at the deadline
+    max_queries: ClassVar[int] = 20
+    max_concurrency: ClassVar[int] = 8
+    deadline_seconds: ClassVar[float] = 30
+    headings: ClassVar[Dict[str, str]] = {
+        "Quick Win": "Quick Wins", "Strategic Initiative": "Strategic Initiatives", "Transformational": "Transformational",
+    }
+
+    def _run(self, queries: List[str]) -> str:
+        return run_sync(self._arun(queries))
+
+    @traced_tool
+    async def _arun(self, queries: List[str]) -> str:
+        try:
+            results = await self.asearch(queries)
+        except Exception as e:
+            return f"❌ Batch search error: {e}"
+        if not results:
+            return "⚠️ No queries provided."
+
+        output = f"# Resource Search ({len(results)} use cases)\n"
+        for query, sections in results.items():
+            output += f"\n## {query}\n"
+            for label, text in sections.items():
+                output += f"### {label}\n{text}\n"
+        return output
+
+    @traced_tool
+    async def asearch_use_cases(self, portfolio) -> str:
+        """Resources for a validated UseCasePortfolio, one search per use case, Quick Wins first"""
+        use_cases = portfolio.by_priority()[: self.max_queries]
+        try:
+            results = await self.asearch([u.search_query for u in use_cases])
+        except Exception as e:
+            return f"❌ Batch search error: {e}"
+
+        output = f"# Resource Asset Collection ({len(use_cases)} use cases)\n"
+        category = None
+        for use_case in use_cases:
+            if use_case.category != category:
+                category = use_case.category
+                output += f"\n## {self.headings.get(category, category)}\n"
+            output += (
+                f"\n### {use_case.name}\n"
+                f"*ROI: {use_case.roi or 'n/a'} | Complexity: {use_case.complexity} | "
+                f"Search: `{use_case.search_query}`*\n"
+            )
+            for label, text in results.get(use_case.search_query, {}).items():
+                output += f"#### {label}\n{text}\n"
+        return output
+
+    async def asearch(self, queries: List[str]) -> Dict[str, Dict[str, str]]:
+        """{query: {platform label: results}}; every (query, platform) search runs concurrently"""
+        # drop blanks and repeats, keep the caller's order
+        unique = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))[: self.max_queries]
+        searches = {"Kaggle Datasets": kaggle_dataset_tool, "GitHub Repositories": github_code_tool}
+        limit = asyncio.Semaphore(self.max_concurrency)
+        tasks = {}
+        try:
+            tasks = {
+                (query, label): asyncio.ensure_future(self._search(tool, query, limit))
+                for query in unique
+                for label, tool in searches.items()
+            }
+            if tasks:
+                await asyncio.wait(tasks.values(), timeout=self.deadline_seconds)
+
+            results = {}
+            for query in unique:
+                results[query] = {}
+                for label in searches:
+                    task = tasks[(query, label)]
+                    if not task.done():
+                        results[query][label] = "- ⏱️ Timed out"
+                    elif task.exception() is not None:
+                        results[query][label] = f"- ❌ Failed: {task.exception()}"
+                    else:
+                        results[query][label] = task.result().strip()
+            return results
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    @staticmethod
+    async def _search(tool: BaseTool, query: str, limit: asyncio.Semaphore) -> str:
+        async with limit:
+            return await tool._arun(query)
+
+
+batch_resource_search_tool = BatchResourceSearchTool()
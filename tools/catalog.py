@@ -0,0 +1,274 @@
+"""
+Dataset Catalog - Local full-text index of Kaggle, HuggingFace and GitHub metadata
+
+Tools look here before calling the network and write network results back, so
+the catalog grows with use; JSON dumps can be imported to work fully offline.
+
+Usage:
+    python -m tools.catalog import kaggle_dump.json --platform kaggle
+    python -m tools.catalog search "customer churn" --platform kaggle
+    python -m tools.catalog stats
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+
+from tools.tracing import tracer
+
+PLATFORMS = ("kaggle", "huggingface", "github")
+FIELDS = ("platform", "ref", "title", "url", "description", "size", "license", "stars", "downloads", "updated")
+
+# words that match nearly every entry and only dilute the query
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "data", "dataset", "datasets"}
+
+# share of query terms an entry must contain; "detection" alone must not answer "fraud detection"
+MIN_COVERAGE = 0.8
+
+
+def normalize(platform: str, raw: Dict) -> Dict:
+    """Map a raw API record (or an already normalized one) to the catalog fields"""
+    # only normalized records carry "platform"; raw API items may share other field names (Kaggle sends "url")
+    if "platform" in raw:
+        record = dict(raw)
+    elif platform == "kaggle":
+        licenses = raw.get("licenses") or []
+        record = {
+            "ref": raw["ref"],
+            "title": raw.get("title", raw["ref"]),
+            "url": raw.get("url") or f"https://www.kaggle.com/datasets/{raw['ref']}",
+            "description": raw.get("subtitle") or raw.get("description", ""),
+            "size": raw.get("size") or raw.get("totalBytes"),
+            "license": ", ".join(l.get("name", "") for l in licenses) if isinstance(licenses, list) else licenses,
+            "downloads": raw.get("downloadCount"),
+            "updated": raw.get("lastUpdated"),
+        }
+    elif platform == "huggingface":
+        record = {
+            "ref": raw["id"],
+            "title": raw["id"],
+            "url": f"https://huggingface.co/datasets/{raw['id']}",
+            "description": raw.get("description", ""),
+            "downloads": raw.get("downloads"),
+            "updated": raw.get("lastModified"),
+        }
+    elif platform == "github":
+        record = {
+            "ref": raw.get("full_name") or raw["html_url"].split("github.com/")[-1],
+            "title": raw["name"],
+            "url": raw["html_url"],
+            "description": raw.get("description", ""),
+            "size": raw.get("size"),
+            "license": (raw.get("license") or {}).get("name") if isinstance(raw.get("license"), dict) else raw.get("license"),
+            "stars": raw.get("stargazers_count"),
+            "updated": raw.get("updated_at"),
+        }
+    else:
+        raise ValueError(f"Unknown platform: {platform}")
+    record["platform"] = platform
+    record["description"] = (record.get("description") or "").strip()
+    return {field: record.get(field) for field in FIELDS}
+
+
+def merge_records(fetched: List[Dict], local: List[Dict]) -> List[Dict]:
+    """Network results first, then local matches the network did not return"""
+    seen = {record["ref"] for record in fetched}
+    return fetched + [record for record in local if record["ref"] not in seen]
+
+
+class Catalog:
+    def __init__(self, path: str = None, enabled: bool = None, max_age_days: float = None, min_hits: int = None):
+        self.path = path or os.getenv("CATALOG_PATH", os.path.join(".cache", "catalog.sqlite"))
+        self.enabled = enabled if enabled is not None else os.getenv("CATALOG", "1") != "0"
+        self.max_age = (max_age_days if max_age_days is not None else float(os.getenv("CATALOG_MAX_AGE_DAYS", "30"))) * 86400
+        self.min_hits = min_hits or int(os.getenv("CATALOG_MIN_HITS", "3"))
+        self._ready = False
+        self._fts = False
+
+    def search(self, platform: str, query: str, limit: int = 3, partial: bool = False) -> List[Dict]:
+        """
+        Best local matches for query, or [] on a miss (fewer than min_hits fresh entries).
+        With `partial`, a miss still returns what matched, for merging with network results.
+        """
+        if not self.enabled:
+            return []
+        terms = [t for t in re.findall(r"\w+", query.lower()) if t not in STOPWORDS]
+        if not terms:
+            return []
+
+        with tracer.span("catalog", platform) as span:
+            cutoff = time.time() - self.max_age
+            with self._connect() as conn:
+                # OR-match candidates, then keep those covering (nearly) every query term
+                if self._fts:
+                    rows = conn.execute(
+                        "SELECT e.* FROM entries_fts f JOIN entries e ON e.rowid = f.rowid "
+                        "WHERE entries_fts MATCH ? AND e.platform = ? AND e.fetched >= ? "
+                        "ORDER BY bm25(entries_fts) LIMIT ?",
+                        (" OR ".join(f'"{t}"*' for t in terms), platform, cutoff, limit * 20),
+                    ).fetchall()
+                else:
+                    where = " OR ".join("(title || ' ' || description) LIKE ?" for _ in terms)
+                    rows = conn.execute(
+                        f"SELECT * FROM entries WHERE platform = ? AND fetched >= ? AND ({where}) LIMIT ?",
+                        (platform, cutoff, *[f"%{t[:6]}%" for t in terms], limit * 20),
+                    ).fetchall()
+
+            scored = []
+            for position, row in enumerate(rows):
+                text = f"{row['title']} {row['description']}".lower()
+                coverage = sum(1 for t in terms if t[:6] in text) / len(terms)
+                if coverage >= MIN_COVERAGE:
+                    popularity = row["stars"] or row["downloads"] or 0
+                    scored.append((-coverage, position, -popularity, {field: row[field] for field in FIELDS}))
+            results = [item[-1] for item in sorted(scored, key=lambda item: item[:3])[:limit]]
+            span["cache_hit"] = len(results) >= min(self.min_hits, limit)
+            return results if span["cache_hit"] or partial else []
+
+    def is_hit(self, results: List[Dict], limit: int = 3) -> bool:
+        """Whether a partial search answers the query without the network"""
+        return len(results) >= min(self.min_hits, limit)
+
+    def upsert(self, platform: str, records: Iterable[Dict]) -> int:
+        """Insert or refresh entries; an entry whose `updated` is older than the stored one is skipped"""
+        if not self.enabled:
+            return 0
+        now = time.time()
+        changed = 0
+        with self._connect() as conn:
+            for raw in records:
+                record = normalize(platform, raw)
+                existing = conn.execute(
+                    "SELECT rowid, updated FROM entries WHERE platform = ? AND ref = ?", (platform, record["ref"])
+                ).fetchone()
+                if existing and existing["updated"] and record["updated"] and record["updated"] < existing["updated"]:
+                    continue
+                values = [record[f] for f in FIELDS]
+                if existing:
+                    conn.execute(
+                        f"UPDATE entries SET {', '.join(f'{f} = ?' for f in FIELDS)}, fetched = ? WHERE rowid = ?",
+                        (*values, now, existing["rowid"]),
+                    )
+                    rowid = existing["rowid"]
+                    if self._fts:
+                        conn.execute("DELETE FROM entries_fts WHERE rowid = ?", (rowid,))
+                else:
+                    rowid = conn.execute(
+                        f"INSERT INTO entries ({', '.join(FIELDS)}, fetched) VALUES ({', '.join('?' * (len(FIELDS) + 1))})",
+                        (*values, now),
+                    ).lastrowid
+                if self._fts:
+                    conn.execute(
+                        "INSERT INTO entries_fts (rowid, title, description) VALUES (?, ?, ?)",
+                        (rowid, record["title"], record["description"]),
+                    )
+                changed += 1
+        return changed
+
+    def import_json(self, path: str, platform: str = None) -> int:
+        """Import a JSON array or JSON-lines dump; records without a platform field need `platform`"""
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        try:
+            payload = json.loads(text)
+            # a list of records, or a search response such as GitHub's {"items": [...]}
+            records = payload if isinstance(payload, list) else payload.get("items", [payload])
+        except json.JSONDecodeError:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+        by_platform: Dict[str, List[Dict]] = {}
+        for record in records:
+            target = record.get("platform") or platform
+            if target not in PLATFORMS:
+                raise ValueError(f"Record without a known platform in {path}; pass --platform")
+            by_platform.setdefault(target, []).append(record)
+        return sum(self.upsert(target, items) for target, items in by_platform.items())
+
+    def prune(self, max_age_days: float = None) -> int:
+        cutoff = time.time() - (max_age_days * 86400 if max_age_days is not None else self.max_age)
+        with self._connect() as conn:
+            if self._fts:
+                conn.execute("DELETE FROM entries_fts WHERE rowid IN (SELECT rowid FROM entries WHERE fetched < ?)", (cutoff,))
+            return conn.execute("DELETE FROM entries WHERE fetched < ?", (cutoff,)).rowcount
+
+    def stats(self) -> Dict:
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT platform, COUNT(*) FROM entries GROUP BY platform").fetchall())
+        return {"path": self.path, "fts5": self._fts, "entries": counts}
+
+    @contextmanager
+    def _connect(self):
+        if not self._ready:
+            self._init_db()
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "platform TEXT, ref TEXT, title TEXT, url TEXT, description TEXT, size TEXT, license TEXT, "
+                "stars INTEGER, downloads INTEGER, updated TEXT, fetched REAL, PRIMARY KEY (platform, ref))"
+            )
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+                    "title, description, tokenize='porter unicode61')"
+                )
+                self._fts = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: fall back to LIKE scans
+                self._fts = False
+            conn.commit()
+        finally:
+            conn.close()
+        self._ready = True
+
+
+catalog = Catalog()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local dataset/repository catalog")
+    sub = parser.add_subparsers(dest="command", required=True)
+    importer = sub.add_parser("import", help="import JSON or JSON-lines dumps")
+    importer.add_argument("paths", nargs="+")
+    importer.add_argument("--platform", choices=PLATFORMS)
+    searcher = sub.add_parser("search", help="query the catalog")
+    searcher.add_argument("query")
+    searcher.add_argument("--platform", choices=PLATFORMS, default="kaggle")
+    searcher.add_argument("--limit", type=int, default=5)
+    pruner = sub.add_parser("prune", help="drop entries older than --days")
+    pruner.add_argument("--days", type=float)
+    sub.add_parser("stats", help="entry counts per platform")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        for path in args.paths:
+            print(f"📥 {path}: {catalog.import_json(path, args.platform)} entries")
+    elif args.command == "search":
+        for item in catalog.search(args.platform, args.query, limit=args.limit):
+            print(f"- {item['title']} ({item['url']})")
+    elif args.command == "prune":
+        print(f"🧹 Removed {catalog.prune(args.days)} entries")
+    else:
+        print(json.dumps(catalog.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,52 @@
 Compact Dataset Search Tool (Improved with Deduplication & Quality)
 """
 
-import requests
+import asyncio
+import os
+
 from crewai.tools import BaseTool
-from typing import List, Dict
+from typing import AsyncIterator, Dict, List
+from tools.aio import run_sync
+from tools.catalog import catalog, merge_records, normalize
+from tools.http_client import HttpError, api_url, http_client
+from tools.tracing import traced_tool
 
 
 class DatasetSearchTool(BaseTool):
     name: str = "Dataset Search Tool"
     description: str = "Search datasets on Kaggle, HuggingFace, GitHub with deduplication"
+    # paged mode: several pages per platform, near-duplicate collapse and ranked top-k
+    paged: bool = False
+    pages: int = 3
+    per_page: int = 30
+    max_candidates: int = 2000
+    top_k: int = 10
 
     def _run(self, search_query: str) -> str:
+        return run_sync(self._arun(search_query))
+
+    @traced_tool
+    async def _arun(self, search_query: str) -> str:
         try:
-            results = {
-                "kaggle": self._search_kaggle(search_query),
-                "huggingface": self._search_huggingface(search_query),
-                "github": self._search_github(search_query),
+            if self.paged:
+                return await self._arun_paged(search_query)
+            searches = {
+                "kaggle": self._search_kaggle,
+                "huggingface": self._search_huggingface,
+                "github": self._search_github,
             }
+            # platforms are searched concurrently; output keeps the order above
+            outcomes = await asyncio.gather(*(search(search_query) for search in searches.values()), return_exceptions=True)
+            results = {}
+            errors = {}
+            for platform, outcome in zip(searches, outcomes):
+                if isinstance(outcome, HttpError):
+                    results[platform] = []
+                    errors[platform] = str(outcome)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    results[platform] = outcome
 
             # Deduplicate results across platforms by title + URL
             seen = set()
@@ -30,11 +60,14 @@ class DatasetSearchTool(BaseTool):
                         unique_items.append(item)
                 results[platform] = unique_items
 
-            return self._format_results(results, search_query)
+            return self._format_results(results, search_query, errors)
         except Exception as e:
             return f"Search error: {str(e)}"
 
-    def _search_kaggle(self, query: str) -> List[Dict]:
+    async def _search_kaggle(self, query: str) -> List[Dict]:
+        local = await asyncio.to_thread(catalog.search, "kaggle", query, 3)
+        if local:
+            return [self._item(r, "7-9/10") for r in local]
         return [
             {
                 "title": f"Kaggle {query} Datasets",
@@ -44,73 +77,121 @@ class DatasetSearchTool(BaseTool):
             }
         ]
 
-    def _search_huggingface(self, query: str) -> List[Dict]:
-        try:
-            url = f"https://huggingface.co/api/datasets?search={query}&limit=3"
-            resp = requests.get(url, timeout=5)
-            results = []
-            if resp.status_code == 200:
-                for item in resp.json()[:3]:
-                    results.append(
-                        {
-                            "title": item.get("id", "").strip(),
-                            "url": f"https://huggingface.co/datasets/{item.get('id')}",
-                            "description": (item.get("description", "") or "No description")[
-                                :100
-                            ]
-                            + "...",
-                            "quality": "8-10/10",
-                        }
-                    )
-            return results
-        except:
-            return [
-                {
-                    "title": f"HuggingFace {query}",
-                    "url": f"https://huggingface.co/datasets?search={query}",
-                    "description": f"ML datasets for {query}",
-                    "quality": "8-10/10",
-                }
-            ]
-
-    def _search_github(self, query: str) -> List[Dict]:
-        try:
-            url = "https://api.github.com/search/repositories"
-            resp = requests.get(
-                url,
+    async def _search_huggingface(self, query: str) -> List[Dict]:
+        records = await asyncio.to_thread(catalog.search, "huggingface", query, 3, True)
+        if not catalog.is_hit(records):
+            items = await http_client.aget_json(
+                "huggingface", api_url("huggingface", "/datasets"), params={"search": query, "limit": 3}, timeout=5
+            )
+            fetched = [normalize("huggingface", item) for item in items[:3]]
+            await asyncio.to_thread(catalog.upsert, "huggingface", fetched)
+            records = merge_records(fetched, records)[:3]
+        return [self._item(r, "8-10/10") for r in records]
+
+    async def _search_github(self, query: str) -> List[Dict]:
+        records = await asyncio.to_thread(catalog.search, "github", query, 3, True)
+        if not catalog.is_hit(records):
+            data = await http_client.aget_json(
+                "github",
+                api_url("github", "/search/repositories"),
                 params={"q": f"{query} dataset", "sort": "stars"},
                 timeout=5,
                 headers={"Accept": "application/vnd.github.v3+json"},
             )
-            results = []
-            if resp.status_code == 200:
-                for item in resp.json().get("items", [])[:3]:
-                    results.append(
-                        {
-                            "title": item["name"].strip(),
-                            "url": item["html_url"],
-                            "description": (item.get("description", "") or "No description")[
-                                :100
-                            ]
-                            + "...",
-                            "quality": f"{min(10, max(1, item.get('stargazers_count', 0)//100))}/10",
-                        }
-                    )
-            return results
-        except:
-            return [
-                {
-                    "title": f"GitHub {query}",
-                    "url": f"https://github.com/search?q={query}+dataset",
-                    "description": f"Code repositories for {query}",
-                    "quality": "6-8/10",
-                }
-            ]
-
-    def _format_results(self, results: Dict, query: str) -> str:
+            fetched = [normalize("github", item) for item in data.get("items", [])[:3]]
+            await asyncio.to_thread(catalog.upsert, "github", fetched)
+            records = merge_records(fetched, records)[:3]
+        return [self._item(r, f"{min(10, max(1, (r['stars'] or 0) // 100))}/10") for r in records]
+
+    @staticmethod
+    def _item(record: Dict, quality: str) -> Dict:
+        return {
+            "title": record["title"].strip(),
+            "url": record["url"],
+            "description": (record["description"] or "No description")[:100] + "...",
+            "quality": quality,
+        }
+
+    async def _arun_paged(self, query: str) -> str:
+        # numpy is only needed here, keep it off the default import path
+        from tools.ranking import top_k
+
+        platforms = ("kaggle", "huggingface", "github")
+        outcomes = await asyncio.gather(*(self._collect(p, query) for p in platforms), return_exceptions=True)
+        candidates, errors = [], {}
+        for platform, outcome in zip(platforms, outcomes):
+            if isinstance(outcome, HttpError):
+                errors[platform] = str(outcome)
+                # the API is down: any relevant local entry beats nothing
+                outcome = await asyncio.to_thread(catalog.search, platform, query, self.per_page, True)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            candidates.extend(outcome)
+        candidates = candidates[: self.max_candidates]
+        # scoring is CPU work; keep it off the event loop
+        ranked = await asyncio.to_thread(top_k, candidates, query, self.top_k)
+        return self._format_ranked(ranked, query, len(candidates), errors)
+
+    async def _collect(self, platform: str, query: str) -> List[Dict]:
+        records = []
+        async for page in self._iter_pages(platform, query):
+            records.extend(page)
+            if len(records) >= self.max_candidates:
+                break
+        return records
+
+    async def _iter_pages(self, platform: str, query: str) -> AsyncIterator[List[Dict]]:
+        """Yield normalized records page by page, stopping at a short or repeated page"""
+        seen = set()
+        for page in range(1, self.pages + 1):
+            if platform == "kaggle":
+                raw = await http_client.aget_json(
+                    "kaggle", api_url("kaggle", "/datasets/list"), params={"search": query, "page": page}, timeout=6
+                )
+            elif platform == "huggingface":
+                # the Hub paginates with Link headers; one request with a larger limit covers the same range
+                raw = await http_client.aget_json(
+                    "huggingface", api_url("huggingface", "/datasets"),
+                    params={"search": query, "limit": self.pages * self.per_page, "full": "true"}, timeout=8,
+                )
+            else:
+                raw = (await http_client.aget_json(
+                    "github",
+                    api_url("github", "/search/repositories"),
+                    params={"q": f"{query} dataset", "sort": "stars", "per_page": self.per_page, "page": page},
+                    timeout=6,
+                    headers={"Accept": "application/vnd.github.v3+json"},
+                )).get("items", [])
+
+            records = [r for r in (normalize(platform, item) for item in raw) if r["ref"] not in seen]
+            seen.update(r["ref"] for r in records)
+            await asyncio.to_thread(catalog.upsert, platform, records)
+            if records:
+                yield records
+            page_size = 20 if platform == "kaggle" else self.per_page
+            if platform == "huggingface" or not records or len(raw) < page_size or len(records) < len(raw):
+                return
+
+    def _format_ranked(self, ranked: List[Dict], query: str, candidates: int, errors: Dict) -> str:
+        output = f"# Dataset Search: {query}\n\n"
+        output += f"Top {len(ranked)} of {candidates} candidates after collapsing duplicates\n\n"
+        for platform, error in errors.items():
+            output += f"- {platform.title()} search failed: {error}\n"
+        for i, item in enumerate(ranked, 1):
+            output += f"{i}. **[{item['title']}]({item['url']})** ({item['platform'].title()}, score {item['score']})\n"
+            output += f"  - {(item['description'] or 'No description')[:100]}\n"
+            if item["duplicates"]:
+                output += f"  - Also at: {', '.join(item['duplicates'][:3])}\n"
+        return output
+
+    def _format_results(self, results: Dict, query: str, errors: Dict = None) -> str:
+        errors = errors or {}
         output = f"# Dataset Search: {query}\n\n"
         for platform, items in results.items():
             output += f"## {platform.title()}\n"
+            if platform in errors:
+                output += f"- Search failed: {errors[platform]}\n"
+                continue
             if not items:
                 output += "- No results found\n"
                 continue
@@ -121,4 +202,4 @@ class DatasetSearchTool(BaseTool):
         return output
 
 
-dataset_search_tool = DatasetSearchTool()
\ No newline at end of file
+dataset_search_tool = DatasetSearchTool(paged=os.getenv("DATASET_SEARCH_PAGED") == "1")
@@ -2,6 +2,9 @@
 Enhanced File Manager Tool - Prevents Truncation
 """
 from crewai.tools import BaseTool
+from tools.aio import run_sync
+from tools.tracing import traced_tool
+import asyncio
 import os
 from datetime import datetime
 
@@ -14,6 +17,10 @@ class FileManagerTool(BaseTool):
         os.makedirs("outputs", exist_ok=True)
 
     def _run(self, content: str, filename: str = None) -> str:
+        return run_sync(self._arun(content, filename))
+
+    @traced_tool
+    async def _arun(self, content: str, filename: str = None) -> str:
         """Save content with proper encoding and full content preservation"""
         try:
             if not filename:
@@ -25,10 +32,8 @@ class FileManagerTool(BaseTool):
             
             filepath = os.path.join("outputs", filename)
             
-            with open(filepath, "w", encoding="utf-8", newline='\n') as f:
-                f.write(content)
-            
-            file_size = os.path.getsize(filepath)
+            # disk writes run off the event loop
+            file_size = await asyncio.to_thread(self._write, filepath, content)
             content_size = len(content.encode('utf-8'))
             
             return f"✅ File saved: {filepath} ({file_size} bytes, content: {content_size} bytes)"
@@ -36,4 +41,10 @@ class FileManagerTool(BaseTool):
         except Exception as e:
             return f"❌ Error saving file: {str(e)}"
 
+    @staticmethod
+    def _write(filepath: str, content: str) -> int:
+        with open(filepath, "w", encoding="utf-8", newline='\n') as f:
+            f.write(content)
+        return os.path.getsize(filepath)
+
 file_manager_tool = FileManagerTool()
\ No newline at end of file
@@ -2,8 +2,12 @@
 Specialized GitHub Code Search Tool
 """
 
-import requests
+import asyncio
 from crewai.tools import BaseTool
+from tools.aio import run_sync
+from tools.catalog import catalog, merge_records, normalize
+from tools.http_client import HttpError, RateLimitError, api_url, http_client, quota_message
+from tools.tracing import traced_tool
 
 
 class GitHubCodeTool(BaseTool):
@@ -11,27 +15,40 @@ class GitHubCodeTool(BaseTool):
     description: str = "Search code repositories directly on GitHub API for AI use cases."
 
     def _run(self, query: str) -> str:
+        return run_sync(self._arun(query))
+
+    @traced_tool
+    async def _arun(self, query: str) -> str:
         try:
-            url = "https://api.github.com/search/repositories"
-            resp = requests.get(
-                url,
-                params={"q": query, "sort": "stars", "order": "desc"},
-                timeout=6,
-                headers={"Accept": "application/vnd.github.v3+json"},
-            )
-            if resp.status_code != 200:
-                return f"GitHub Search failed ({resp.status_code})"
-
-            repos = resp.json().get("items", [])[:3]
+            local = await asyncio.to_thread(catalog.search, "github", query, 3, True)
+            repos = local
+            if not catalog.is_hit(local):
+                url = api_url("github", "/search/repositories")
+                data = await http_client.aget_json(
+                    "github",
+                    url,
+                    params={"q": query, "sort": "stars", "order": "desc"},
+                    timeout=6,
+                    headers={"Accept": "application/vnd.github.v3+json"},
+                )
+                fetched = [normalize("github", r) for r in data.get("items", [])]
+                await asyncio.to_thread(catalog.upsert, "github", fetched)
+                repos = merge_records(fetched, local)
+
+            repos = repos[:3]
             results = []
             for r in repos:
                 results.append(
-                    f"- **[{r['name']}]({r['html_url']})** ⭐ {r['stargazers_count']}\n"
-                    f"  - {r.get('description','No description')}\n"
+                    f"- **[{r['title']}]({r['url']})** ⭐ {r['stars'] or 0}\n"
+                    f"  - {r['description'] or 'No description'}\n"
                 )
             return "\n".join(results) if repos else "No GitHub repos found."
+        except RateLimitError as e:
+            return quota_message("GitHub", e)
+        except HttpError as e:
+            return f"GitHub Search failed ({e})"
         except Exception as e:
             return f"GitHub error: {e}"
 
 
-github_code_tool = GitHubCodeTool()
\ No newline at end of file
+github_code_tool = GitHubCodeTool()
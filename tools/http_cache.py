@@ -0,0 +1,151 @@
+"""
+Persistent Response Cache - SQLite-backed with per-provider TTL and LRU eviction
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+# seconds each provider's responses stay fresh
+DEFAULT_TTLS = {
+    "tavily": 6 * 3600,
+    "github": 24 * 3600,
+    "kaggle": 24 * 3600,
+    "huggingface": 24 * 3600,
+    "links": 7 * 24 * 3600,
+}
+
+
+class ResponseCache:
+    """Key/value store for API responses shared by all tools and processes."""
+
+    def __init__(self, path: str = None, max_bytes: int = None, ttls: Dict[str, int] = None,
+                 default_ttl: int = 24 * 3600):
+        self.path = path or os.getenv("HTTP_CACHE_PATH", os.path.join(".cache", "http_cache.sqlite"))
+        self.max_bytes = max_bytes or int(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.enabled = os.getenv("HTTP_CACHE", "1") != "0"
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._ready = False
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Dict = None, body: Any = None) -> str:
+        """Hash a request so equivalent calls share one entry."""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query += [(k, v) for k, v in (params or {}).items() if v is not None]
+        query = sorted((str(k), " ".join(str(v).split())) for k, v in query)
+        base = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", "", ""))
+        normalized = json.dumps(
+            [method.upper(), base, query, body], sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, provider: str, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        ttl = self.ttls.get(provider, self.default_ttl)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+                if row and now - row[1] <= ttl:
+                    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                    self._count(self.hits, provider)
+                    return json.loads(row[0])
+                if row:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except (sqlite3.Error, OSError):
+            pass
+        self._count(self.misses, provider)
+        return None
+
+    def set(self, provider: str, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        payload = json.dumps(value)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, provider, value, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, provider, payload, len(payload), now, now),
+                )
+                self._evict(conn)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self, provider: str = None) -> None:
+        with self._connect() as conn:
+            if provider:
+                conn.execute("DELETE FROM entries WHERE provider = ?", (provider,))
+            else:
+                conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus current store size."""
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"hits": dict(self.hits), "misses": dict(self.misses), "entries": entries, "bytes": size}
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the store fits under max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def _count(self, counter: Dict[str, int], provider: str) -> None:
+        with self._lock:
+            counter[provider] = counter.get(provider, 0) + 1
+
+    @contextmanager
+    def _connect(self):
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._init_db()
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, provider TEXT, value TEXT, size INTEGER, "
+                "created REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed)")
+            conn.commit()
+        finally:
+            conn.close()
+        self._ready = True
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,229 @@
+"""
+Shared HTTP Client - Pooled keep-alive async connections with rate limiting, retry/backoff and caching
+"""
+
+import asyncio
+import os
+import random
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import httpx
+
+from tools.aio import on_loop_exit, run_sync
+from tools.http_cache import ResponseCache, response_cache
+from tools.rate_limit import RateLimiter, rate_limiter
+from tools.tracing import tracer
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# overridable so tools can point at proxies or the offline benchmark stubs
+API_BASE_URLS = {
+    "tavily": os.getenv("TAVILY_API_URL", "https://api.tavily.com"),
+    "github": os.getenv("GITHUB_API_URL", "https://api.github.com"),
+    "kaggle": os.getenv("KAGGLE_API_URL", "https://www.kaggle.com/api/v1"),
+    "huggingface": os.getenv("HUGGINGFACE_API_URL", "https://huggingface.co/api"),
+}
+
+
+def api_url(provider: str, path: str) -> str:
+    return API_BASE_URLS[provider].rstrip("/") + path
+
+
+class HttpError(Exception):
+    """Request to an external API failed after all retries."""
+
+    def __init__(self, provider: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.status = status
+
+
+class RateLimitError(HttpError):
+    """Provider kept rejecting the request for quota reasons."""
+
+    def __init__(self, provider: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(provider, f"rate limited ({status})", status)
+        self.retry_after = retry_after
+
+
+class HttpConnectionError(HttpError):
+    """Provider could not be reached (DNS, connect, read timeout)."""
+
+
+def quota_message(label: str, error: RateLimitError) -> str:
+    """Tool output for an exhausted quota that tells the agent not to retry straight away"""
+    wait = f" for ~{error.retry_after:.0f}s" if error.retry_after else ""
+    return f"⏳ {label} quota exhausted{wait}. Do not retry now; continue with the results you already have."
+
+
+class HttpClient:
+    """
+    Pooled keep-alive connections per event loop, shared by every tool in the process.
+
+    The async methods are the implementation; the sync ones run them on the shared
+    background loop (tools/aio.py), so blocking callers reuse the same connections.
+    """
+
+    def __init__(self, timeout: float = None, max_retries: int = None, backoff_base: float = 0.5,
+                 backoff_max: float = 30, pool_size: int = 10, cache: ResponseCache = response_cache,
+                 limiter: RateLimiter = rate_limiter):
+        self.timeout = timeout or float(os.getenv("HTTP_TIMEOUT", "10"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("HTTP_MAX_RETRIES", "3"))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_size = pool_size
+        self.cache = cache
+        self.limiter = limiter
+        # an httpx.AsyncClient is bound to the loop it was first used on
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_json(self, provider: str, url: str, params: Dict = None, **kwargs) -> Any:
+        return run_sync(self.arequest_json(provider, "GET", url, params=params, **kwargs))
+
+    def post_json(self, provider: str, url: str, json: Any = None, **kwargs) -> Any:
+        return run_sync(self.arequest_json(provider, "POST", url, json=json, **kwargs))
+
+    def request_json(self, provider: str, method: str, url: str, **kwargs) -> Any:
+        return run_sync(self.arequest_json(provider, method, url, **kwargs))
+
+    async def aget_json(self, provider: str, url: str, params: Dict = None, **kwargs) -> Any:
+        return await self.arequest_json(provider, "GET", url, params=params, **kwargs)
+
+    async def apost_json(self, provider: str, url: str, json: Any = None, **kwargs) -> Any:
+        return await self.arequest_json(provider, "POST", url, json=json, **kwargs)
+
+    async def arequest_json(self, provider: str, method: str, url: str, params: Dict = None, json: Any = None,
+                            headers: Dict = None, timeout: float = None, use_cache: bool = True) -> Any:
+        """Send a request and return the decoded JSON body, serving from cache when fresh."""
+        with tracer.span("http", provider, method=method, cache_hit=False) as span:
+            cache_key = self.cache.make_key(method, url, params, json)
+            if use_cache:
+                cached = await asyncio.to_thread(self.cache.get, provider, cache_key)
+                if cached is not None:
+                    span["cache_hit"] = True
+                    return cached
+            data = await self._send(provider, method, url, params, json, headers, timeout, span)
+            if use_cache:
+                await asyncio.to_thread(self.cache.set, provider, cache_key, data)
+            return data
+
+    async def acheck_url(self, url: str, timeout: float = None) -> int:
+        """
+        Status code of a link (0 when unreachable), via HEAD with a GET fallback for servers
+        that refuse HEAD. Definitive answers are cached under the "links" provider.
+        """
+        with tracer.span("http", "links", method="HEAD", cache_hit=False) as span:
+            cache_key = self.cache.make_key("HEAD", url)
+            cached = await asyncio.to_thread(self.cache.get, "links", cache_key)
+            if cached is not None:
+                span["cache_hit"] = True
+                return cached
+            client = self._client()
+            try:
+                resp = await client.head(url, timeout=timeout or self.timeout)
+                if resp.status_code in (403, 405, 501):
+                    async with client.stream("GET", url, timeout=timeout or self.timeout) as resp:
+                        pass
+            except (httpx.TransportError, httpx.InvalidURL):
+                return 0
+            span["status"] = resp.status_code
+            if resp.status_code < 400 or resp.status_code in (404, 410):
+                await asyncio.to_thread(self.cache.set, "links", cache_key, resp.status_code)
+            return resp.status_code
+
+    async def _send(self, provider, method, url, params, json, headers, timeout, span) -> Any:
+        client = self._client()
+        for attempt in range(self.max_retries + 1):
+            span["attempts"] = attempt + 1
+            last_attempt = attempt == self.max_retries
+            waited, reserved = await self.limiter.acquire(provider)
+            if not reserved:
+                # the provider's own quota resets too far out to wait for
+                raise RateLimitError(provider, 429, waited)
+            if waited:
+                span["throttled_s"] = round(span.get("throttled_s", 0) + waited, 3)
+            try:
+                resp = await client.request(
+                    method, url, params=params, json=json, headers=headers, timeout=timeout or self.timeout
+                )
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise HttpConnectionError(provider, str(e) or type(e).__name__) from e
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            span["status"] = resp.status_code
+            retry_after = self._retry_after(resp)
+            hints = self.limiter.hints(resp.status_code, resp.headers, retry_after)
+            if hints:
+                await asyncio.to_thread(self.limiter.observe, provider, hints)
+            if resp.status_code < 400:
+                span["response_bytes"] = len(resp.content)
+                try:
+                    return resp.json()
+                except ValueError as e:
+                    raise HttpError(provider, "invalid JSON response", resp.status_code) from e
+
+            rate_limited = self._is_rate_limited(resp)
+            if not (rate_limited or resp.status_code in RETRY_STATUSES):
+                raise HttpError(provider, f"HTTP {resp.status_code}: {resp.text[:200]}", resp.status_code)
+
+            if last_attempt:
+                if rate_limited:
+                    raise RateLimitError(provider, resp.status_code, retry_after)
+                raise HttpError(provider, f"HTTP {resp.status_code} after {attempt + 1} attempts", resp.status_code)
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    async def aclose(self) -> None:
+        """Close the running loop's connection pool; run_sync does this before a temporary loop ends"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            limits = httpx.Limits(max_connections=self.pool_size * 4, max_keepalive_connections=self.pool_size)
+            client = httpx.AsyncClient(limits=limits, follow_redirects=True)
+            self._clients[loop] = client
+        return client
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential delay, never shorter than the server's Retry-After."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    @staticmethod
+    def _is_rate_limited(resp: httpx.Response) -> bool:
+        # GitHub signals exhausted quota with 403 + X-RateLimit-Remaining: 0
+        return resp.status_code == 429 or (
+            resp.status_code == 403 and resp.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    @staticmethod
+    def _retry_after(resp: httpx.Response) -> Optional[float]:
+        value = resp.headers.get("Retry-After")
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    return None
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return max(0.0, int(reset) - time.time())
+        return None
+
+
+http_client = HttpClient()
+on_loop_exit(http_client.aclose)
@@ -2,8 +2,12 @@
 Specialized Kaggle Dataset Tool
 """
 
-import requests
+import asyncio
 from crewai.tools import BaseTool
+from tools.aio import run_sync
+from tools.catalog import catalog, merge_records, normalize
+from tools.http_client import HttpError, RateLimitError, api_url, http_client, quota_message
+from tools.tracing import traced_tool
 
 
 class KaggleDatasetTool(BaseTool):
@@ -11,24 +15,37 @@ class KaggleDatasetTool(BaseTool):
     description: str = "Search datasets directly via Kaggle API."
 
     def _run(self, query: str) -> str:
-        try:
-            url = f"https://www.kaggle.com/api/v1/datasets/list"
-            headers = {"User-Agent": "Mozilla"}  # if kaggle requires login, adjust with creds
-            resp = requests.get(url, params={"search": query}, headers=headers, timeout=6)
+        return run_sync(self._arun(query))
 
-            if resp.status_code != 200:
-                return f"Kaggle Search failed ({resp.status_code})"
+    @traced_tool
+    async def _arun(self, query: str) -> str:
+        try:
+            local = await asyncio.to_thread(catalog.search, "kaggle", query, 3, True)
+            datasets = local
+            if not catalog.is_hit(local):
+                url = api_url("kaggle", "/datasets/list")
+                headers = {"User-Agent": "Mozilla"}  # if kaggle requires login, adjust with creds
+                raw = await http_client.aget_json(
+                    "kaggle", url, params={"search": query}, headers=headers, timeout=6
+                )
+                fetched = [normalize("kaggle", ds) for ds in raw]
+                await asyncio.to_thread(catalog.upsert, "kaggle", fetched)
+                datasets = merge_records(fetched, local)
 
             results = []
-            for ds in resp.json()[:3]:
+            for ds in datasets[:3]:
                 results.append(
-                    f"- **[{ds['title']}]({'https://www.kaggle.com/datasets/'+ds['ref']})**\n"
-                    f"  - Size: {ds.get('size','Unknown')} - {ds.get('licenses','N/A')}\n"
+                    f"- **[{ds['title']}]({ds['url']})**\n"
+                    f"  - Size: {ds['size'] or 'Unknown'} - {ds['license'] or 'N/A'}\n"
                 )
 
             return "\n".join(results) if results else "No Kaggle datasets found."
+        except RateLimitError as e:
+            return quota_message("Kaggle", e)
+        except HttpError as e:
+            return f"Kaggle Search failed ({e})"
         except Exception as e:
             return f"Kaggle error: {e}"
 
 
-kaggle_dataset_tool = KaggleDatasetTool()
\ No newline at end of file
+kaggle_dataset_tool = KaggleDatasetTool()
@@ -0,0 +1,159 @@
+"""
+Ranking - URL canonicalization, near-duplicate collapse and batched candidate scoring
+
+Works on catalog-shaped records (see tools/catalog.py) and stays linear in the
+number of candidates: MinHash signatures with LSH banding find duplicate pairs,
+and all ranking features are scored as one NumPy matrix.
+"""
+
+import math
+import re
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+TRACKING_PARAMS = {"ref", "source", "fbclid", "gclid"}
+# stars/downloads, recency, size, query match
+DEFAULT_WEIGHTS = (0.35, 0.2, 0.1, 0.35)
+
+_MERSENNE = (1 << 61) - 1
+_NUM_PERM = 32
+_BANDS = 8
+_rng = np.random.default_rng(20240601)
+_PERM_A = _rng.integers(1, 1 << 31, size=_NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 31, size=_NUM_PERM, dtype=np.uint64)
+
+_SIZE_UNITS = {"b": 1, "kb": 1e3, "mb": 1e6, "gb": 1e9, "tb": 1e12}
+
+
+def canonical_url(url: str) -> str:
+    """Lowercase scheme/host, drop www., fragments, tracking params and trailing slashes/.git"""
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    path = re.sub(r"(\.git)?/*$", "", parts.path)
+    if host in ("github.com", "huggingface.co", "kaggle.com"):
+        path = path.lower()
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query) if k not in TRACKING_PARAMS and not k.startswith("utm_")
+    ))
+    return urlunsplit(("https", host, path, query, ""))
+
+
+def normalized_title(title: str) -> str:
+    """Title reduced to lowercase word characters, ignoring owner prefixes and separators"""
+    title = (title or "").split("/")[-1]
+    return " ".join(re.findall(r"[a-z0-9]+", title.lower().replace("_", " ").replace("-", " ")))
+
+
+def _signature(text: str) -> np.ndarray:
+    shingles = {text[i:i + 3] for i in range(max(1, len(text) - 2))}
+    x = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+    return ((_PERM_A[:, None] * x[None, :] + _PERM_B[:, None]) % _MERSENNE).min(axis=1)
+
+
+def collapse_duplicates(records: Sequence[Dict], scores: np.ndarray, threshold: float = 0.8) -> List[List[int]]:
+    """
+    Group records that share a canonical URL or have near-identical titles.
+
+    Records are visited best-score first and join the cluster of a matching
+    representative, so similarity never chains across a whole result set.
+    Returns clusters of indices, best cluster first, each ordered best-score first.
+    """
+    if not len(records):
+        return []
+    order = np.argsort(-scores, kind="stable")
+    signatures = np.stack([_signature(normalized_title(r["title"])) for r in records])
+    rows = _NUM_PERM // _BANDS
+    band_keys = [signatures[:, b * rows:(b + 1) * rows] for b in range(_BANDS)]
+
+    clusters: List[List[int]] = []
+    by_url: Dict[str, int] = {}
+    by_band: List[Dict[bytes, List[int]]] = [{} for _ in range(_BANDS)]
+    for i in order:
+        url = canonical_url(records[i]["url"])
+        cluster = by_url.get(url)
+        if cluster is None:
+            candidates = {c for b in range(_BANDS) for c in by_band[b].get(band_keys[b][i].tobytes(), ())}
+            for c in sorted(candidates):
+                if (signatures[clusters[c][0]] == signatures[i]).mean() >= threshold:
+                    cluster = c
+                    break
+        if cluster is None:
+            cluster = len(clusters)
+            clusters.append([])
+            for b in range(_BANDS):
+                by_band[b].setdefault(band_keys[b][i].tobytes(), []).append(cluster)
+        clusters[cluster].append(int(i))
+        by_url.setdefault(url, cluster)
+    return clusters
+
+
+def _parse_size(value) -> float:
+    if value is None or value == "":
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    # a bare "." (as in "v1. MB") is not a number
+    match = re.match(r"\s*(\d+(?:\.\d+)?|\.\d+)\s*([kmgt]?b)?", str(value).lower())
+    if not match:
+        return math.nan
+    return float(match.group(1)) * _SIZE_UNITS.get(match.group(2) or "b", 1)
+
+
+def _age_days(value, now: datetime) -> float:
+    if not value:
+        return math.nan
+    try:
+        updated = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return math.nan
+    if updated.tzinfo is None:
+        updated = updated.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - updated).total_seconds() / 86400)
+
+
+def _minmax(column: np.ndarray) -> np.ndarray:
+    column = np.where(np.isnan(column), np.nanmedian(column) if not np.isnan(column).all() else 0.0, column)
+    span = column.max() - column.min()
+    return (column - column.min()) / span if span > 0 else np.zeros_like(column)
+
+
+def score(records: Sequence[Dict], query: str, weights: Sequence[float] = DEFAULT_WEIGHTS) -> np.ndarray:
+    """One score per record from popularity, recency, size and query-term coverage"""
+    if not records:
+        return np.zeros(0)
+    now = datetime.now(timezone.utc)
+    terms = [t for t in re.findall(r"[a-z0-9]+", query.lower()) if len(t) > 2]
+    features = np.empty((len(records), 4))
+    for i, r in enumerate(records):
+        popularity = r.get("stars") if r.get("stars") is not None else r.get("downloads")
+        text = f"{r['title']} {r.get('description') or ''}".lower()
+        features[i] = (
+            math.log1p(popularity) if popularity is not None else math.nan,
+            _age_days(r.get("updated"), now),
+            # GitHub reports repository size in KB
+            math.log1p(_parse_size(r.get("size")) * (1024 if r.get("platform") == "github" else 1)),
+            sum(t[:6] in text for t in terms) / len(terms) if terms else 0.0,
+        )
+
+    popularity = _minmax(features[:, 0])
+    recency = 1.0 - _minmax(features[:, 1])
+    size = _minmax(features[:, 2])
+    match = features[:, 3]
+    return np.column_stack((popularity, recency, size, match)) @ np.asarray(weights, dtype=float)
+
+
+def top_k(records: Sequence[Dict], query: str, k: int = 10, threshold: float = 0.8) -> List[Dict]:
+    """Best k records after collapsing duplicates; each carries score and its duplicates' URLs"""
+    scores = score(records, query)
+    clusters = collapse_duplicates(records, scores, threshold)[:k]
+    ranked = []
+    for members in clusters:
+        best = dict(records[members[0]])
+        best["score"] = round(float(scores[members[0]]), 3)
+        best["duplicates"] = [records[i]["url"] for i in members[1:]]
+        ranked.append(best)
+    return ranked
@@ -0,0 +1,207 @@
+"""
+Rate Limiter - Per-provider token buckets shared by every process through SQLite
+
+Callers reserve the next free slot instead of failing: the bucket may go negative,
+and each caller sleeps until its reserved token has refilled, which spreads bursts
+from many crews and batch workers evenly over the provider's quota. A caller that
+is cancelled while queued (e.g. by a search deadline) gives its token back. Buckets learn
+from X-RateLimit-* and Retry-After headers, so a quota spent elsewhere (or a
+smaller one than configured) pauses everyone until the provider's reset time.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Mapping, Optional, Tuple
+
+# (requests, per seconds); override with RATE_LIMIT_<PROVIDER>="30/60"
+DEFAULT_RATES = {
+    "github": (10, 60),  # unauthenticated search API
+    "kaggle": (60, 60),
+    "tavily": (100, 60),
+    "huggingface": (500, 300),
+}
+
+
+def _parse_rate(value: str) -> Optional[Tuple[float, float]]:
+    try:
+        requests, seconds = value.split("/")
+        return float(requests), float(seconds)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket per provider in `.cache/rate_limits.sqlite`, safe across threads and processes."""
+
+    def __init__(self, path: str = None, rates: Dict[str, Tuple[float, float]] = None, max_wait: float = None):
+        self.path = path or os.getenv("RATE_LIMIT_PATH", os.path.join(".cache", "rate_limits.sqlite"))
+        self.enabled = os.getenv("RATE_LIMIT", "1") != "0"
+        self.max_wait = max_wait if max_wait is not None else float(os.getenv("RATE_LIMIT_MAX_WAIT", "60"))
+        self.rates = dict(rates or DEFAULT_RATES)
+        for provider in list(self.rates):
+            override = _parse_rate(os.getenv(f"RATE_LIMIT_{provider.upper()}", ""))
+            if override:
+                self.rates[provider] = override
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def reserve(self, provider: str) -> Tuple[float, bool]:
+        """
+        Take a token (possibly one that has not refilled yet) and return (seconds to wait, True).
+        Our own quota always queues; only a provider block lasting over max_wait returns
+        (block length, False) without taking a token.
+        """
+        if not self.enabled or provider not in self.rates:
+            return 0.0, True
+        requests, seconds = self.rates[provider]
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                tokens, capacity, updated, blocked_until = self._bucket(conn, provider, requests)
+                if blocked_until - now > self.max_wait:
+                    # the provider says its quota resets too far out to queue for; let the caller report it
+                    return blocked_until - now, False
+                tokens = min(capacity, tokens + (now - updated) * requests / seconds) - 1
+                conn.execute(
+                    "UPDATE buckets SET tokens = ?, updated = ? WHERE provider = ?", (tokens, now, provider)
+                )
+                return max(0.0, -tokens * seconds / requests, blocked_until - now), True
+        except (sqlite3.Error, OSError):
+            return 0.0, True
+
+    def refund(self, provider: str) -> None:
+        """Give back a token whose request was never sent (e.g. cancelled by a deadline while queued)"""
+        if not self.enabled or provider not in self.rates:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "UPDATE buckets SET tokens = MIN(capacity, tokens + 1) WHERE provider = ?", (provider,)
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    async def acquire(self, provider: str) -> Tuple[float, bool]:
+        """Wait for a token; returns reserve()'s (delay, reserved), and a cancelled wait refunds the token"""
+        reservation = asyncio.ensure_future(asyncio.to_thread(self.reserve, provider))
+
+        def refund_if_reserved(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is None and done.result()[1]:
+                self.refund(provider)
+
+        try:
+            wait, reserved = await asyncio.shield(reservation)
+        except asyncio.CancelledError:
+            # the reservation still completes in its thread; return the token once it has
+            reservation.add_done_callback(refund_if_reserved)
+            raise
+        if reserved and wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund(provider)
+                raise
+        return wait, reserved
+
+    @staticmethod
+    def hints(status: int, headers: Mapping[str, str], retry_after: Optional[float]) -> Optional[Dict]:
+        """What a response says about the provider's quota, or None when it says nothing"""
+        hints = {}
+        limit, remaining = headers.get("X-RateLimit-Limit"), headers.get("X-RateLimit-Remaining")
+        if limit and limit.isdigit():
+            hints["capacity"] = float(limit)
+        if remaining and remaining.isdigit():
+            hints["remaining"] = float(remaining)
+        if retry_after is not None and (status == 429 or hints.get("remaining") == 0):
+            hints["blocked_until"] = time.time() + retry_after
+        return hints or None
+
+    def observe(self, provider: str, hints: Dict) -> None:
+        """Fold header hints into the shared bucket"""
+        if not self.enabled or provider not in self.rates:
+            return
+        requests, _ = self.rates[provider]
+        try:
+            with self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                tokens, capacity, updated, blocked_until = self._bucket(conn, provider, requests)
+                if "capacity" in hints:
+                    capacity = hints["capacity"]
+                if "remaining" in hints:
+                    # never more than the provider says is left (other clients share the quota)
+                    tokens = min(tokens, hints["remaining"])
+                if "blocked_until" in hints:
+                    blocked_until = max(blocked_until, hints["blocked_until"])
+                    tokens = min(tokens, 0.0)
+                conn.execute(
+                    "UPDATE buckets SET tokens = ?, capacity = ?, blocked_until = ? WHERE provider = ?",
+                    (tokens, capacity, blocked_until, provider),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT provider, tokens, capacity, updated, blocked_until FROM buckets").fetchall()
+        return {
+            p: {"tokens": round(t, 2), "capacity": c, "blocked_for": max(0.0, round(b - time.time(), 1))}
+            for p, t, c, _, b in rows
+        }
+
+    @staticmethod
+    def _bucket(conn: sqlite3.Connection, provider: str, requests: float) -> Tuple[float, float, float, float]:
+        row = conn.execute(
+            "SELECT tokens, capacity, updated, blocked_until FROM buckets WHERE provider = ?", (provider,)
+        ).fetchone()
+        if row:
+            return row
+        now = time.time()
+        conn.execute(
+            "INSERT INTO buckets (provider, tokens, capacity, updated, blocked_until) VALUES (?, ?, ?, ?, 0)",
+            (provider, requests, requests, now),
+        )
+        return requests, requests, now, 0.0
+
+    @contextmanager
+    def _connect(self):
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._init_db()
+        # autocommit mode so BEGIN IMMEDIATE takes the write lock before the bucket is read
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "provider TEXT PRIMARY KEY, tokens REAL, capacity REAL, updated REAL, blocked_until REAL)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._ready = True
+
+
+rate_limiter = RateLimiter()
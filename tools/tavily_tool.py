@@ -2,24 +2,21 @@
 Tavily Search Tool Wrapper
 """
 
-from crewai_tools import TavilySearchTool
+from crewai.tools import BaseTool
+import json
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
+from tools.aio import run_sync
+from tools.http_client import HttpError, RateLimitError, api_url, http_client, quota_message
+from tools.tracing import traced_tool
 
 load_dotenv()
 
 class TavilyTool:
     def __init__(self):
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            raise ValueError("Missing TAVILY_API_KEY")
-        self.tool = TavilySearchTool(
-            api_key=api_key,
-            search_depth="advanced",
-            max_results=5,
-            include_raw_content=False,
-            include_images=False
-        )
+        # every Tavily request goes through the shared client, so it counts against the rate limit
+        self.tool = get_tavily_tool()
 
     def search_industry(self, query: str):
         return self.tool.run(f"industry analysis market research {query} 2024")
@@ -31,5 +28,37 @@ class TavilyTool:
         return self.tool.run(f"{company} competitors market positioning {industry}")
 
 
-tavily = TavilyTool().tool
+class TavilyAPITool(BaseTool):
+    name: str = "Tavily Search"
+    description: str = "Search the web via the Tavily API for market, industry and company research."
+
+    def _run(self, query: str) -> str:
+        return run_sync(self._arun(query))
+
+    @traced_tool
+    async def _arun(self, query: str) -> str:
+        payload = {
+            "query": query,
+            "search_depth": "advanced",
+            "max_results": 5,
+            "include_raw_content": False,
+            "include_images": False,
+        }
+        headers = {"Authorization": f"Bearer {os.getenv('TAVILY_API_KEY', '')}"}
+        try:
+            data = await http_client.apost_json("tavily", api_url("tavily", "/search"), json=payload, headers=headers)
+        except RateLimitError as e:
+            return quota_message("Tavily", e)
+        except HttpError as e:
+            return f"Tavily Search failed ({e})"
+        return json.dumps(data.get("results", []), indent=2)
+
+
+@lru_cache(maxsize=None)
+def get_tavily_tool() -> BaseTool:
+    """Shared Tavily search tool, built on first use so a missing key only fails when research runs"""
+    if not os.getenv("TAVILY_API_KEY"):
+        raise ValueError("Missing TAVILY_API_KEY")
+    # traced and sent through the shared HTTP client; TAVILY_API_URL points it at a proxy or stub
+    return TavilyAPITool()
 
@@ -0,0 +1,170 @@
+"""
+Tracing - Lightweight spans for tasks, LLM calls, tools and HTTP requests
+
+Spans are tagged with the run that produced them: the context running a task
+carries its run id (and hands it to coroutines it awaits on the shared tool loop),
+and work on other threads falls back to the only active run.
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+
+class Tracer:
+    def __init__(self, max_spans: int = 20000):
+        self.spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._run_id = contextvars.ContextVar("trace_run_id", default=None)
+        self._active_runs = set()
+
+    @contextmanager
+    def run(self, run_id: str = None):
+        """Mark a crew run as active and tag spans on this thread with its id"""
+        run_id = run_id or uuid.uuid4().hex[:12]
+        with self._lock:
+            self._active_runs.add(run_id)
+        with self.bind(run_id):
+            try:
+                yield run_id
+            finally:
+                with self._lock:
+                    self._active_runs.discard(run_id)
+
+    @contextmanager
+    def bind(self, run_id: Optional[str]):
+        """Attribute spans recorded on the current thread to run_id"""
+        token = self._run_id.set(run_id)
+        try:
+            yield
+        finally:
+            self._run_id.reset(token)
+
+    def current_run(self) -> Optional[str]:
+        run_id = self._run_id.get()
+        if run_id is None:
+            with self._lock:
+                if len(self._active_runs) == 1:
+                    run_id = next(iter(self._active_runs))
+        return run_id
+
+    @contextmanager
+    def span(self, kind: str, name: str, **attrs):
+        """Time a block; callers may add attributes (sizes, tokens, cache_hit) to the yielded dict"""
+        record = {"run_id": self.current_run(), "kind": kind, "name": name, "start": time.time(), **attrs}
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = f"{type(e).__name__}: {e}"[:300]
+            raise
+        finally:
+            record["duration"] = round(time.perf_counter() - started, 4)
+            with self._lock:
+                self.spans.append(record)
+
+    def collect(self, run_id: str = None) -> List[Dict]:
+        with self._lock:
+            return [dict(s) for s in self.spans if run_id is None or s["run_id"] == run_id]
+
+    def discard(self, run_id: str) -> None:
+        """Forget a finished run's spans so long-lived processes keep room for live runs"""
+        with self._lock:
+            kept = [s for s in self.spans if s["run_id"] != run_id]
+            self.spans.clear()
+            self.spans.extend(kept)
+
+    def export_jsonl(self, path: str, run_id: str = None) -> None:
+        with open(path, "a", encoding="utf-8") as f:
+            for span in self.collect(run_id):
+                f.write(json.dumps(span, default=str) + "\n")
+
+    @staticmethod
+    def summarize(spans: Iterable[Dict]) -> List[Dict]:
+        """Aggregate spans by (kind, name, tier): count, total/max duration, errors, cache hits, fallbacks, tokens"""
+        groups: Dict[tuple, Dict] = {}
+        for span in spans:
+            key = (span["kind"], span["name"], span.get("tier"))
+            group = groups.setdefault(key, {
+                "kind": span["kind"], "name": span["name"], "tier": span.get("tier"), "count": 0, "total_s": 0.0,
+                "max_s": 0.0, "errors": 0, "cache_hits": 0, "fallbacks": 0, "prompt_tokens": 0, "completion_tokens": 0,
+            })
+            group["count"] += 1
+            group["total_s"] = round(group["total_s"] + span["duration"], 4)
+            group["max_s"] = max(group["max_s"], span["duration"])
+            group["errors"] += 1 if span.get("error") else 0
+            group["cache_hits"] += 1 if span.get("cache_hit") else 0
+            group["fallbacks"] += 1 if span.get("fallback") else 0
+            group["prompt_tokens"] += span.get("prompt_tokens", 0)
+            group["completion_tokens"] += span.get("completion_tokens", 0)
+        return sorted(groups.values(), key=lambda g: g["total_s"], reverse=True)
+
+    def prometheus_text(self, run_id: str = None) -> str:
+        """Prometheus exposition format of the aggregated spans"""
+        lines = [
+            "# HELP researchagent_span_duration_seconds Time spent in tasks, LLM calls, tools and HTTP requests",
+            "# TYPE researchagent_span_duration_seconds summary",
+        ]
+        summary = self.summarize(self.collect(run_id))
+        for g in summary:
+            labels = _labels(g)
+            lines.append(f"researchagent_span_duration_seconds_sum{{{labels}}} {g['total_s']}")
+            lines.append(f"researchagent_span_duration_seconds_count{{{labels}}} {g['count']}")
+        for metric, field, help_text in (
+            ("researchagent_span_errors_total", "errors", "Spans that ended with an error"),
+            ("researchagent_cache_hits_total", "cache_hits", "Spans served from a cache"),
+            ("researchagent_llm_fallbacks_total", "fallbacks", "LLM calls that timed out and moved to the fallback tier"),
+            ("researchagent_prompt_tokens_total", "prompt_tokens", "Estimated prompt tokens sent to LLMs"),
+            ("researchagent_completion_tokens_total", "completion_tokens", "Estimated completion tokens"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for g in summary:
+                lines.append(f"{metric}{{{_labels(g)}}} {g[field]}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(group: Dict) -> str:
+    labels = f'kind="{group["kind"]}",name="{_escape(group["name"])}"'
+    return labels + (f',tier="{_escape(group["tier"])}"' if group.get("tier") else "")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _size(value) -> int:
+    return len(value) if isinstance(value, (str, bytes)) else len(str(value))
+
+
+def traced_tool(fn):
+    """Wrap a BaseTool._run or _arun so each call records a "tool" span with input/output sizes"""
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            with tracer.span("tool", self.name, input_chars=sum(_size(a) for a in (*args, *kwargs.values()))) as span:
+                result = await fn(self, *args, **kwargs)
+                span["output_chars"] = _size(result)
+                return result
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with tracer.span("tool", self.name, input_chars=sum(_size(a) for a in (*args, *kwargs.values()))) as span:
+            result = fn(self, *args, **kwargs)
+            span["output_chars"] = _size(result)
+            return result
+
+    return wrapper
+
+
+tracer = Tracer()
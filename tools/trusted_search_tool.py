@@ -2,10 +2,13 @@
 Trusted Search Tool - Proper Tavily API with Trusted Sources
 """
 
+import asyncio
 import os
-import requests
 from crewai.tools import BaseTool
 from typing import List, ClassVar
+from tools.aio import run_sync
+from tools.http_client import api_url, http_client
+from tools.tracing import traced_tool
 
 class TrustedSearchTool(BaseTool):
     name: str = "Trusted Search Tool"
@@ -22,34 +25,75 @@ class TrustedSearchTool(BaseTool):
         "starbucks.com"  # official newsroom
     ]
 
+    # one search per domain, all in flight at once so every domain gets the full deadline;
+    # slow domains are dropped when it passes
+    max_workers: ClassVar[int] = len(trusted_sites)
+    request_timeout: ClassVar[float] = 10
+    deadline_seconds: ClassVar[float] = 15
+
     def _run(self, query: str) -> str:
+        return run_sync(self._arun(query))
+
+    @traced_tool
+    async def _arun(self, query: str) -> str:
         api_key = os.getenv("TAVILY_API_KEY")
         if not api_key:
             return "❌ Tavily API key missing."
 
         headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
         results = []
+        timed_out = []
+        failed = []
 
+        limit = asyncio.Semaphore(self.max_workers)
+        tasks = {}
         try:
-            # loop through trusted sites
-            for site in self.trusted_sites:
-                payload = {"query": f"site:{site} {query}", "max_results": 3}
-                resp = requests.post("https://api.tavily.com/search", headers=headers, json=payload, timeout=10)
-
-                if resp.status_code == 200:
-                    for r in resp.json().get("results", []):
-                        results.append(
-                            f"- **[{r.get('title','No Title')}]({r.get('url','')})** ({site})\n"
-                            f"  - {(r.get('content','') or '')[:150]}...\n"
-                        )
+            tasks = {
+                site: asyncio.ensure_future(self._search_site(site, query, headers, limit))
+                for site in self.trusted_sites
+            }
+            await asyncio.wait(tasks.values(), timeout=self.deadline_seconds)
 
-            if not results:
-                return "⚠️ No results found even on trusted domains."
-
-            return "### Trusted Results:\n\n" + "\n".join(results)
+            # collect in trusted_sites order so output stays stable
+            for site, task in tasks.items():
+                if not task.done():
+                    timed_out.append(site)
+                    continue
+                error = task.exception()
+                if error is None:
+                    results.extend(task.result())
+                else:
+                    failed.append(f"{site} ({error})")
 
         except Exception as e:
             return f"❌ Trusted search error: {e}"
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        footer = f"\n\n⏱️ Timed out: {', '.join(timed_out)}" if timed_out else ""
+        if failed:
+            footer += f"\n\n❌ Failed: {', '.join(failed)}"
+
+        if not results:
+            return "⚠️ No results found even on trusted domains." + footer
+
+        return "### Trusted Results:\n\n" + "\n".join(results) + footer
+
+    async def _search_site(self, site: str, query: str, headers: dict, limit: asyncio.Semaphore) -> List[str]:
+        payload = {"query": f"site:{site} {query}", "max_results": 3}
+        async with limit:
+            data = await http_client.apost_json(
+                "tavily", api_url("tavily", "/search"), json=payload, headers=headers, timeout=self.request_timeout
+            )
+
+        results = []
+        for r in data.get("results", []):
+            results.append(
+                f"- **[{r.get('title','No Title')}]({r.get('url','')})** ({site})\n"
+                f"  - {(r.get('content','') or '')[:150]}...\n"
+            )
+        return results
 
 
-trusted_search_tool = TrustedSearchTool()
\ No newline at end of file
+trusted_search_tool = TrustedSearchTool()
@@ -0,0 +1,8 @@
+"""
+Shared helpers
+"""
+
+
+def company_slug(company_name: str) -> str:
+    """File-name friendly form of a company name, as used for outputs/ artifacts"""
+    return company_name.strip().lower().replace(" ", "_")